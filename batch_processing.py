@@ -17,6 +17,13 @@ from datetime import datetime
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
 
+# orjson parses large article dumps several times faster than the
+# standard library; fall back to json when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # ============================================================================
 # Output Formatter
 # ============================================================================
@@ -213,7 +220,7 @@ class AnnotationFormatter:
         if who and who.get('metadata'):
             actor_type = who['metadata'].get('type', '')
             
-            if actor_type in ['terrorist', 'rebel']:
+            if actor_type in {'terrorist', 'rebel'}:
                 return 'Political Violence'
             elif actor_type == 'criminal':
                 return 'Criminal Violence'
@@ -457,8 +464,8 @@ class ArticleLoader:
             ...
         ]
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
+        with open(file_path, 'rb') as f:
+            articles = _json_loads(f.read())
         return articles
     
     @staticmethod
@@ -632,7 +639,8 @@ def main():
     config = {
         'stanford_corenlp': {
             'path': './stanford-corenlp-4.5.5',
-            'memory': '4g'
+            'memory': '4g',
+            'use_coref': True  # Event extraction resolves actors via coreference
         },
         'output': {
             'directory': args.output
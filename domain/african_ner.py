@@ -1,6 +1,34 @@
 import json
 from typing import Dict, List, Tuple
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_gazetteer_automaton(entries: List[Tuple[str, str, Dict]]):
+    """
+    Build an Aho-Corasick automaton over lowercased gazetteer names, so a
+    sentence is scanned once however large the gazetteer is. Each name maps
+    to its positions in entries (names can repeat once lowercased). Returns
+    None if pyahocorasick is not installed or there are no names.
+    """
+    if ahocorasick is None or not entries:
+        return None
+    
+    positions: Dict[str, List[int]] = {}
+    for idx, (key, _, _) in enumerate(entries):
+        if key:
+            positions.setdefault(key, []).append(idx)
+    
+    automaton = ahocorasick.Automaton()
+    for key, indices in positions.items():
+        automaton.add_word(key, tuple(indices))
+    automaton.make_automaton()
+    return automaton
+
+
 class AfricanNER:
     """
     Named Entity Recognition enhanced for African contexts.
@@ -16,6 +44,18 @@ class AfricanNER:
         """
         self.locations = self._load_locations(location_db_path)
         self.actors = self._load_actors(actor_db_path)
+        
+        # (lowercased name, name, metadata) in gazetteer order; actors are
+        # listed under their acronym and, if present, their full name
+        self._location_entries = [(name.lower(), name, metadata)
+                                  for name, metadata in self.locations.items()]
+        self._actor_entries = []
+        for name, metadata in self.actors.items():
+            self._actor_entries.append((name.lower(), name, metadata))
+            if 'full_name' in metadata:
+                self._actor_entries.append((metadata['full_name'].lower(), name, metadata))
+        self._location_automaton = _build_gazetteer_automaton(self._location_entries)
+        self._actor_automaton = _build_gazetteer_automaton(self._actor_entries)
     
     def _load_locations(self, path: str = None) -> Dict:
         """Load African location database."""
@@ -100,13 +140,7 @@ class AfricanNER:
         Returns:
             List of (location_name, metadata) tuples
         """
-        found = []
-        
-        for location, metadata in self.locations.items():
-            if location.lower() in text.lower():
-                found.append((location, metadata))
-        
-        return found
+        return self._find_names(text, self._location_entries, self._location_automaton)
     
     def recognize_actor(self, text: str) -> List[Tuple[str, Dict]]:
         """
@@ -115,19 +149,21 @@ class AfricanNER:
         Returns:
             List of (actor_name, metadata) tuples
         """
-        found = []
+        # Acronym and full name are matched separately, so an actor
+        # mentioned both ways is reported twice
+        return self._find_names(text, self._actor_entries, self._actor_automaton)
+    
+    def _find_names(self, text: str, entries: List[Tuple[str, str, Dict]],
+                    automaton) -> List[Tuple[str, Dict]]:
+        """Find gazetteer names occurring in text, in gazetteer order."""
+        text_lower = text.lower()
         
-        for actor, metadata in self.actors.items():
-            # Check full name and acronym
-            if actor.lower() in text.lower():
-                found.append((actor, metadata))
-            
-            # Check full name if exists
-            if 'full_name' in metadata:
-                if metadata['full_name'].lower() in text.lower():
-                    found.append((actor, metadata))
+        if automaton is None:
+            return [(name, metadata) for key, name, metadata in entries if key in text_lower]
         
-        return found
+        # Overlapping matches are reported too (e.g. 'Sudan' in 'South Sudan')
+        matched = sorted({idx for _, indices in automaton.iter(text_lower) for idx in indices})
+        return [entries[idx][1:] for idx in matched]
     
     def enhance_ner(self, entities: List[Dict], text: str) -> List[Dict]:
         """
@@ -141,12 +177,15 @@ class AfricanNER:
             Enhanced entity list
         """
         enhanced = entities.copy()
+        # Lowercased texts of the entities collected so far
+        seen = {e['text'].lower() for e in enhanced}
         
         # Add African locations
         locations = self.recognize_location(text)
         for loc_name, metadata in locations:
             # Check if not already in entities
-            if not any(e['text'].lower() == loc_name.lower() for e in enhanced):
+            if loc_name.lower() not in seen:
+                seen.add(loc_name.lower())
                 enhanced.append({
                     'text': loc_name,
                     'type': 'LOCATION',
@@ -157,7 +196,8 @@ class AfricanNER:
         # Add armed groups
         actors = self.recognize_actor(text)
         for actor_name, metadata in actors:
-            if not any(e['text'].lower() == actor_name.lower() for e in enhanced):
+            if actor_name.lower() not in seen:
+                seen.add(actor_name.lower())
                 enhanced.append({
                     'text': actor_name,
                     'type': 'ORGANIZATION',
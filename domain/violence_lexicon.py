@@ -12,6 +12,12 @@ class ViolenceLexicon:
         self.actors = self._load_actor_terms()
         self.weapons = self._load_weapon_terms()
         self.all_terms = self.verbs | self.nouns | self.actors | self.weapons
+        # Term -> category in one lookup table. Later updates win, so terms
+        # listed in several sets keep the verb > noun > actor > weapon order.
+        self.term_categories: Dict[str, str] = {}
+        for terms, category in ((self.weapons, 'weapon'), (self.actors, 'actor'),
+                                (self.nouns, 'violence_noun'), (self.verbs, 'violence_verb')):
+            self.term_categories.update(dict.fromkeys(terms, category))
     
     def _load_violence_verbs(self) -> Set[str]:
         """Violence action verbs."""
@@ -128,18 +134,7 @@ class ViolenceLexicon:
     
     def get_term_category(self, word: str) -> str:
         """Get category of violence term."""
-        word_lower = word.lower()
-        
-        if word_lower in self.verbs:
-            return 'violence_verb'
-        elif word_lower in self.nouns:
-            return 'violence_noun'
-        elif word_lower in self.actors:
-            return 'actor'
-        elif word_lower in self.weapons:
-            return 'weapon'
-        else:
-            return 'other'
+        return self.term_categories.get(word.lower(), 'other')
     
     def save_to_file(self, filepath: str):
         """Save lexicon to text file."""
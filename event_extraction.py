@@ -128,6 +128,108 @@ class EventTriggerDetector:
 # 5W1H Extractor
 # ============================================================================
 
+# Keyword tables are built once per process rather than on every call
+
+# Trigger lemmas by preliminary event type
+_KILLING_VERBS = frozenset({'kill', 'murder', 'assassinate', 'execute', 'massacre', 'slay'})
+_BOMBING_VERBS = frozenset({'bomb', 'explode', 'detonate', 'blast'})
+_SHOOTING_VERBS = frozenset({'shoot', 'fire', 'gun'})
+_KIDNAP_VERBS = frozenset({'kidnap', 'abduct', 'seize', 'capture'})
+_ATTACK_VERBS = frozenset({'attack', 'assault', 'raid', 'storm', 'ambush'})
+_ROBBERY_VERBS = frozenset({'rob', 'robbery', 'loot', 'steal', 'stole'})
+
+# Relative temporal words
+_TEMPORAL_WORDS = frozenset({'yesterday', 'today', 'tonight', 'monday', 'tuesday',
+                            'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+                            'morning', 'afternoon', 'evening', 'night'})
+
+# Expanded weapon keywords
+_WEAPON_TERMS = frozenset({
+    # Firearms
+    'gun', 'rifle', 'rifles', 'pistol', 'pistols', 'firearm', 'firearms',
+    'ak-47', 'ak47', 'kalashnikov', 'm16', 'weapon', 'weapons',
+    # Explosives
+    'bomb', 'bombs', 'explosive', 'explosives', 'ied', 'grenade', 'grenades',
+    'rocket', 'rpg', 'mortar', 'mine', 'mines',
+    # Edged weapons
+    'knife', 'knives', 'machete', 'machetes', 'blade', 'sword', 'spear', 'spears',
+    # Other
+    'ammunition', 'bullet', 'bullets', 'shell', 'device'
+})
+
+# Expanded tactical keywords
+_TACTIC_TERMS = frozenset({
+    'ambush', 'raid', 'assault', 'attack', 'attacks',
+    'suicide', 'car-bomb', 'roadside', 'ied',
+    'stormed', 'storm'
+})
+
+# Multi-word weapons searched in the sentence text
+_MULTI_WORD_WEAPONS = {
+    'live ammunition': 'live ammunition',
+    'tear gas': 'tear gas',
+    'rubber bullets': 'rubber bullets',
+    'molotov cocktail': 'Molotov cocktail',
+    'improvised explosive': 'improvised explosive',
+    'explosive device': 'explosive device',
+    'suicide bomb': 'suicide bomb',
+    'car bomb': 'car bomb'
+}
+
+# Known actor indicators (including known organizations)
+_ACTOR_KEYWORDS = frozenset({
+    'group', 'force', 'forces', 'army', 'military', 'police', 'officer', 'officers',
+    'soldier', 'soldiers', 'troop', 'troops', 'militant', 'militants', 'fighter', 'fighters',
+    'rebel', 'rebels', 'insurgent', 'insurgents', 'terrorist', 'terrorists',
+    'gang', 'gunman', 'gunmen', 'attacker', 'attackers', 'bomber',
+    'shabaab', 'boko', 'haram', 'aqim', 'isis', 'al-qaeda', 'al-shabaab',
+    'supporters', 'protesters', 'demonstrators', 'community', 'communities', 'militia', 'militias',
+    # Common African ethnic/communal groups
+    'hema', 'lendu', 'hutu', 'tutsi', 'fulani', 'hausa', 'yoruba', 'igbo',
+    'nuer', 'dinka', 'shona', 'ndebele', 'zulu', 'xhosa',
+    # Other actor types
+    'herders', 'farmers', 'pastoralists', 'nomads', 'tribesmen'
+})
+
+# Obvious non-actors (substring match)
+_NON_ACTOR_INDICATORS = frozenset({
+    # Places
+    'market', 'markets', 'building', 'buildings', 'town', 'city', 'village',
+    'street', 'road', 'area', 'region', 'country', 'province', 'state',
+    'restaurant', 'hotel', 'mosque', 'church', 'school', 'hospital',
+    # Times/descriptive words
+    'morning', 'afternoon', 'evening', 'night', 'day', 'week', 'month',
+    'violent', 'recent', 'deadly', 'latest', 'ongoing'
+})
+
+# Articles/determiners and single letters (as complete words only)
+_SINGLE_WORD_NON_ACTORS = frozenset({
+    'the', 'a', 'an', 'this', 'that', 'these', 'those',
+    'during', 'after', 'before', 'in', 'at', 'on', 'by'
+})
+
+# Common ethnic group names that should NOT be treated as locations
+_ETHNIC_GROUP_NAMES = frozenset({'hema', 'lendu', 'hutu', 'tutsi', 'fulani', 'hausa', 'yoruba', 'igbo', 'nuer', 'dinka', 'shona', 'ndebele', 'zulu', 'xhosa'})
+
+# Expanded civilian indicators to include common victim descriptions
+_CIVILIAN_INDICATORS = frozenset({
+    'civilian', 'people', 'resident', 'villager', 'child', 'woman', 'man',
+    'casualt', 'victim', 'student', 'customer', 'vendor', 'shopper',
+    'passenger', 'worker', 'employee', 'guard', 'bystander', 'protester',
+    'demonstrator', 'supporter', 'citizen'
+})
+_COMBATANT_INDICATORS = frozenset({
+    'soldier', 'troop', 'military', 'police', 'fighter', 'officer',
+    'security force', 'armed force', 'combatant'
+})
+
+# Actor type keywords
+_TERRORIST_INDICATORS = frozenset({'militant', 'extremist', 'jihadist', 'terrorist'})
+_REBEL_INDICATORS = frozenset({'rebel', 'insurgent', 'fighter'})
+_STATE_INDICATORS = frozenset({'military', 'army', 'police', 'soldier', 'troop', 'force'})
+_CRIMINAL_INDICATORS = frozenset({'gunman', 'gang', 'robber', 'bandit'})
+
+
 class FiveW1HExtractor:
     """
     Extract Who, What, Whom, Where, When, How from violent events.
@@ -199,28 +301,20 @@ class FiveW1HExtractor:
     
     def _classify_event_type(self, trigger_lemma: str, sentence_text: str = '') -> str:
         """Preliminary event classification from trigger."""
-        # Map trigger to event type
-        killing_verbs = {'kill', 'murder', 'assassinate', 'execute', 'massacre', 'slay'}
-        bombing_verbs = {'bomb', 'explode', 'detonate', 'blast'}
-        shooting_verbs = {'shoot', 'fire', 'gun'}
-        kidnap_verbs = {'kidnap', 'abduct', 'seize', 'capture'}
-        attack_verbs = {'attack', 'assault', 'raid', 'storm', 'ambush'}
-        robbery_verbs = {'rob', 'robbery', 'loot', 'steal', 'stole'}
-        
         # Also check sentence context for robbery indicators
         sentence_lower = sentence_text.lower() if sentence_text else ''
         
-        if trigger_lemma in killing_verbs:
+        if trigger_lemma in _KILLING_VERBS:
             return 'killing'
-        elif trigger_lemma in bombing_verbs:
+        elif trigger_lemma in _BOMBING_VERBS:
             return 'bombing'
-        elif trigger_lemma in robbery_verbs or 'rob' in sentence_lower or 'robbed' in sentence_lower or 'robbery' in sentence_lower:
+        elif trigger_lemma in _ROBBERY_VERBS or 'rob' in sentence_lower or 'robbed' in sentence_lower or 'robbery' in sentence_lower:
             return 'robbery'
-        elif trigger_lemma in shooting_verbs:
+        elif trigger_lemma in _SHOOTING_VERBS:
             return 'shooting'
-        elif trigger_lemma in kidnap_verbs:
+        elif trigger_lemma in _KIDNAP_VERBS:
             return 'kidnapping'
-        elif trigger_lemma in attack_verbs:
+        elif trigger_lemma in _ATTACK_VERBS:
             return 'armed_attack'
         else:
             return 'violence'
@@ -268,7 +362,7 @@ class FiveW1HExtractor:
 
             # Match against trigger position (both 0-indexed and 1-indexed)
             if gov == trigger_idx + 1 or gov == trigger_idx:
-                if dep_type in ['nsubj', 'nsubjpass', 'agent', 'csubj']:
+                if dep_type in {'nsubj', 'nsubjpass', 'agent', 'csubj'}:
                     actor_idx = dep.get('dependent')
                     # Normalize to 0-indexed
                     if actor_idx > 0:
@@ -278,7 +372,7 @@ class FiveW1HExtractor:
         # Approach 2: Look for ORGANIZATION or PERSON entities before trigger
         if actor_idx is None:
             for entity in entities:
-                if entity.get('type') in ['ORGANIZATION', 'PERSON']:
+                if entity.get('type') in {'ORGANIZATION', 'PERSON'}:
                     # Check if entity appears before trigger in sentence
                     entity_text = entity.get('text', '')
                     if entity_text and entity_text in text:
@@ -364,7 +458,7 @@ class FiveW1HExtractor:
         subject_end_idx = None
 
         for dep in dependencies:
-            if dep.get('dep') in ['nsubj', 'nsubjpass', 'agent']:
+            if dep.get('dep') in {'nsubj', 'nsubjpass', 'agent'}:
                 if dep.get('governor', '').lower() == trigger_word:
                     subject_text = dep.get('dependent')
                     # Find token indices for this subject
@@ -455,8 +549,6 @@ class FiveW1HExtractor:
         Returns:
             Actor dict or None
         """
-        import re
-
         # Patterns for responsibility claims
         patterns = [
             r'([A-Z][A-Za-z\-\s]+?)\s+claimed responsibility',
@@ -512,8 +604,6 @@ class FiveW1HExtractor:
         Returns:
             Actor dict or None
         """
-        import re
-
         # Pattern 1: [Number] + [Actor noun] + [verb]
         # Examples: "Three police officers", "A suicide bomber", "Six gunmen"
         patterns = [
@@ -565,7 +655,7 @@ class FiveW1HExtractor:
 
             # Match against trigger position
             if gov == trigger_idx + 1 or gov == trigger_idx:
-                if dep_type in ['dobj', 'nmod', 'obl', 'iobj', 'nmod:poss', 'obl:tmod']:
+                if dep_type in {'dobj', 'nmod', 'obl', 'iobj', 'nmod:poss', 'obl:tmod'}:
                     victim_idx = dep.get('dependent')
                     # Normalize to 0-indexed
                     if victim_idx > 0:
@@ -574,7 +664,7 @@ class FiveW1HExtractor:
                     # Make sure it's not a location or temporal expression
                     if 0 <= victim_idx < len(tokens):
                         token = tokens[victim_idx]
-                        if not token.get('ner', '') in ['LOCATION', 'DATE', 'TIME']:
+                        if token.get('ner', '') not in {'LOCATION', 'DATE', 'TIME'}:
                             break
                     victim_idx = None
 
@@ -635,7 +725,7 @@ class FiveW1HExtractor:
                 casualties = self._extract_casualties_from_sentence(text)
                 if casualties.get('deaths') or casualties.get('injuries'):
                     # Found casualties with victim type
-                    victim_type = 'combatant' if indicator in ['officer', 'officers', 'soldier', 'soldiers', 'guard'] else 'civilian'
+                    victim_type = 'combatant' if indicator in {'officer', 'officers', 'soldier', 'soldiers', 'guard'} else 'civilian'
                     return {
                         'text': indicator,
                         'deaths': casualties.get('deaths'),
@@ -666,15 +756,11 @@ class FiveW1HExtractor:
         
         # CRITICAL FIX: Also exclude common ethnic/communal group names that might be confused with locations
         # Extract base names (remove words like "community", "communities", "herders", "farmers")
-        import re
         actor_base = re.sub(r'\s+(?:community|communities|herders?|farmers?|pastoralists?|people|members?|supporters?|officers?|forces?|soldiers?)\b', '', actor_name, flags=re.IGNORECASE).strip()
         victim_base = re.sub(r'\s+(?:community|communities|herders?|farmers?|pastoralists?|people|members?|supporters?|officers?|forces?|soldiers?)\b', '', victim_name, flags=re.IGNORECASE).strip()
         
-        # Common ethnic group names that should NOT be treated as locations
-        ethnic_group_names = {'hema', 'lendu', 'hutu', 'tutsi', 'fulani', 'hausa', 'yoruba', 'igbo', 'nuer', 'dinka', 'shona', 'ndebele', 'zulu', 'xhosa'}
-        
         exclude_names = {actor_name, victim_name, actor_base, victim_base} - {''}  # Remove empty strings
-        exclude_names.update(ethnic_group_names)  # Add ethnic group names to exclusion list
+        exclude_names.update(_ETHNIC_GROUP_NAMES)  # Add ethnic group names to exclusion list
 
         # Find location entities, excluding actor/victim names and ethnic groups
         locations = []
@@ -688,7 +774,7 @@ class FiveW1HExtractor:
                     if exclude_name and (location_text == exclude_name or location_text in exclude_name or exclude_name in location_text):
                         # Double-check: if it's a known location (e.g., "Beni" is a real city), don't exclude
                         # Only exclude if it's clearly an ethnic group name
-                        if location_text in ethnic_group_names:
+                        if location_text in _ETHNIC_GROUP_NAMES:
                             should_exclude = True
                             break
                         # If exclude_name is part of location_text but location_text is longer, it might be a real location
@@ -705,7 +791,7 @@ class FiveW1HExtractor:
             for location in locations:
                 metadata = location.get('metadata', {})
                 loc_type = metadata.get('type', 'UNKNOWN')
-                if loc_type in ['CITY', 'COUNTRY', 'REGION']:
+                if loc_type in {'CITY', 'COUNTRY', 'REGION'}:
                     return {
                         'text': location['text'],
                         'type': loc_type,
@@ -791,12 +877,8 @@ class FiveW1HExtractor:
             }
 
         # Look for temporal words
-        temporal_words = {'yesterday', 'today', 'tonight', 'monday', 'tuesday',
-                         'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
-                         'morning', 'afternoon', 'evening', 'night'}
-
         for token in tokens:
-            if token.get('lemma', '').lower() in temporal_words:
+            if token.get('lemma', '').lower() in _TEMPORAL_WORDS:
                 date_text = token['word']
                 normalized = None
                 if normalizer and article_date:
@@ -819,27 +901,6 @@ class FiveW1HExtractor:
         tokens = sent_ann.get('tokens', [])
         text = sent_ann.get('text', '')
 
-        # Expanded weapon keywords
-        weapons = {
-            # Firearms
-            'gun', 'rifle', 'rifles', 'pistol', 'pistols', 'firearm', 'firearms',
-            'ak-47', 'ak47', 'kalashnikov', 'm16', 'weapon', 'weapons',
-            # Explosives
-            'bomb', 'bombs', 'explosive', 'explosives', 'ied', 'grenade', 'grenades',
-            'rocket', 'rpg', 'mortar', 'mine', 'mines',
-            # Edged weapons
-            'knife', 'knives', 'machete', 'machetes', 'blade', 'sword', 'spear', 'spears',
-            # Other
-            'ammunition', 'bullet', 'bullets', 'shell', 'device'
-        }
-
-        # Expanded tactical keywords
-        tactics = {
-            'ambush', 'raid', 'assault', 'attack', 'attacks',
-            'suicide', 'car-bomb', 'roadside', 'ied',
-            'stormed', 'storm'
-        }
-
         found_weapons = []
         found_tactics = []
 
@@ -848,25 +909,14 @@ class FiveW1HExtractor:
             word_lower = token.get('word', '').lower()
             lemma = token.get('lemma', '').lower()
 
-            if lemma in weapons or word_lower in weapons:
+            if lemma in _WEAPON_TERMS or word_lower in _WEAPON_TERMS:
                 found_weapons.append(token['word'].lower())
-            if lemma in tactics or word_lower in tactics:
+            if lemma in _TACTIC_TERMS or word_lower in _TACTIC_TERMS:
                 found_tactics.append(token['word'].lower())
 
         # Also search text for multi-word weapons
         text_lower = text.lower()
-        multi_word_weapons = {
-            'live ammunition': 'live ammunition',
-            'tear gas': 'tear gas',
-            'rubber bullets': 'rubber bullets',
-            'molotov cocktail': 'Molotov cocktail',
-            'improvised explosive': 'improvised explosive',
-            'explosive device': 'explosive device',
-            'suicide bomb': 'suicide bomb',
-            'car bomb': 'car bomb'
-        }
-
-        for pattern, weapon_name in multi_word_weapons.items():
+        for pattern, weapon_name in _MULTI_WORD_WEAPONS.items():
             if pattern in text_lower:
                 found_weapons.append(weapon_name)
 
@@ -896,49 +946,18 @@ class FiveW1HExtractor:
         """Check if text looks like an actor/perpetrator."""
         text_lower = text.lower()
 
-        # Known actor indicators (including known organizations)
-        actor_keywords = {
-            'group', 'force', 'forces', 'army', 'military', 'police', 'officer', 'officers',
-            'soldier', 'soldiers', 'troop', 'troops', 'militant', 'militants', 'fighter', 'fighters',
-            'rebel', 'rebels', 'insurgent', 'insurgents', 'terrorist', 'terrorists',
-            'gang', 'gunman', 'gunmen', 'attacker', 'attackers', 'bomber',
-            'shabaab', 'boko', 'haram', 'aqim', 'isis', 'al-qaeda', 'al-shabaab',
-            'supporters', 'protesters', 'demonstrators', 'community', 'communities', 'militia', 'militias',
-            # Common African ethnic/communal groups
-            'hema', 'lendu', 'hutu', 'tutsi', 'fulani', 'hausa', 'yoruba', 'igbo',
-            'nuer', 'dinka', 'shona', 'ndebele', 'zulu', 'xhosa',
-            # Other actor types
-            'herders', 'farmers', 'pastoralists', 'nomads', 'tribesmen'
-        }
-
         # CRITICAL: Check actor keywords FIRST (before non-actor check)
         # This prevents false rejections like "a" in "al-shabaab"
-        if any(keyword in text_lower for keyword in actor_keywords):
+        if any(keyword in text_lower for keyword in _ACTOR_KEYWORDS):
             return True
 
         # CRITICAL: Exclude obvious non-actors (using word boundaries)
-        non_actor_indicators = {
-            # Places
-            'market', 'markets', 'building', 'buildings', 'town', 'city', 'village',
-            'street', 'road', 'area', 'region', 'country', 'province', 'state',
-            'restaurant', 'hotel', 'mosque', 'church', 'school', 'hospital',
-            # Times/descriptive words
-            'morning', 'afternoon', 'evening', 'night', 'day', 'week', 'month',
-            'violent', 'recent', 'deadly', 'latest', 'ongoing'
-        }
-
-        # Articles/determiners and single letters (as complete words only)
-        single_word_non_actors = {
-            'the', 'a', 'an', 'this', 'that', 'these', 'those',
-            'during', 'after', 'before', 'in', 'at', 'on', 'by'
-        }
-
         # Check if text is EXACTLY one of the single-word non-actors
-        if text_lower in single_word_non_actors:
+        if text_lower in _SINGLE_WORD_NON_ACTORS:
             return False
 
         # Check for non-actor indicators (substring match)
-        if any(non_actor in text_lower for non_actor in non_actor_indicators):
+        if any(non_actor in text_lower for non_actor in _NON_ACTOR_INDICATORS):
             return False
 
         # Reject if contains numbers (but not as part of a larger name)
@@ -1148,7 +1167,7 @@ class FiveW1HExtractor:
             # Try both 1-indexed and 0-indexed
             if gov == head_idx + 1 or gov == head_idx:
                 dep_type = dep.get('dep', '')
-                if dep_type in ['det', 'amod', 'compound', 'nummod', 'nmod', 'case', 'advmod']:
+                if dep_type in {'det', 'amod', 'compound', 'nummod', 'nmod', 'case', 'advmod'}:
                     dependent = dep.get('dependent')
                     # Normalize to 0-indexed
                     if dependent > 0:
@@ -1213,22 +1232,10 @@ class FiveW1HExtractor:
 
         text_lower = victim_text.lower()
 
-        # Expanded civilian indicators to include common victim descriptions
-        civilian_indicators = {
-            'civilian', 'people', 'resident', 'villager', 'child', 'woman', 'man',
-            'casualt', 'victim', 'student', 'customer', 'vendor', 'shopper',
-            'passenger', 'worker', 'employee', 'guard', 'bystander', 'protester',
-            'demonstrator', 'supporter', 'citizen'
-        }
-        combatant_indicators = {
-            'soldier', 'troop', 'military', 'police', 'fighter', 'officer',
-            'security force', 'armed force', 'combatant'
-        }
-
         # Check combatants first (more specific)
-        if any(ind in text_lower for ind in combatant_indicators):
+        if any(ind in text_lower for ind in _COMBATANT_INDICATORS):
             return 'combatant'
-        elif any(ind in text_lower for ind in civilian_indicators):
+        elif any(ind in text_lower for ind in _CIVILIAN_INDICATORS):
             return 'civilian'
         else:
             return 'unknown'
@@ -1245,7 +1252,7 @@ class FiveW1HExtractor:
         # Check if it's a known armed group
         for entity in entities:
             if entity.get('type') == 'ORGANIZATION':
-                if entity.get('subtype') in ['TERRORIST', 'REBEL']:
+                if entity.get('subtype') in {'TERRORIST', 'REBEL'}:
                     return {
                         'type': entity.get('subtype').lower(),
                         'known_group': True,
@@ -1253,18 +1260,13 @@ class FiveW1HExtractor:
                     }
         
         # Infer from keywords
-        terrorist_indicators = {'militant', 'extremist', 'jihadist', 'terrorist'}
-        rebel_indicators = {'rebel', 'insurgent', 'fighter'}
-        state_indicators = {'military', 'army', 'police', 'soldier', 'troop', 'force'}
-        criminal_indicators = {'gunman', 'gang', 'robber', 'bandit'}
-        
-        if any(ind in text_lower for ind in state_indicators):
+        if any(ind in text_lower for ind in _STATE_INDICATORS):
             return {'type': 'state', 'known_group': False}
-        elif any(ind in text_lower for ind in terrorist_indicators):
+        elif any(ind in text_lower for ind in _TERRORIST_INDICATORS):
             return {'type': 'terrorist', 'known_group': False}
-        elif any(ind in text_lower for ind in rebel_indicators):
+        elif any(ind in text_lower for ind in _REBEL_INDICATORS):
             return {'type': 'rebel', 'known_group': False}
-        elif any(ind in text_lower for ind in criminal_indicators):
+        elif any(ind in text_lower for ind in _CRIMINAL_INDICATORS):
             return {'type': 'criminal', 'known_group': False}
         
         return {'type': 'unknown', 'known_group': False}
@@ -1372,7 +1374,7 @@ class EventExtractor:
 
         # First pass: Detect and split reciprocal violence events
         events = self._detect_reciprocal_violence(events, sentences, article_text)
-        self.logger.debug(f"After reciprocal violence detection: {len(events)} events")
+        self.logger.debug("After reciprocal violence detection: %d events", len(events))
 
         # Re-classify taxonomy for events modified by reciprocal violence detection
         if self.taxonomy_classifier:
@@ -1385,20 +1387,20 @@ class EventExtractor:
 
         # Second pass: Merge events within same/adjacent sentences
         events = self._merge_similar_events(events)
-        self.logger.debug(f"After merge similar events: {len(events)} events")
+        self.logger.debug("After merge similar events: %d events", len(events))
 
         # Third pass: CLUSTER events across entire article (coreference resolution)
         events = self._cluster_coreferent_events(events, article_annotation)
-        self.logger.debug(f"After cluster coreferent events: {len(events)} events")
+        self.logger.debug("After cluster coreferent events: %d events", len(events))
 
         # Fourth pass: Filter by salience (keep only main newsworthy events, not background context)
         events = self._filter_by_salience(events, article_annotation)
-        self.logger.debug(f"After salience filtering: {len(events)} events")
+        self.logger.debug("After salience filtering: %d events", len(events))
 
         # Filter out very low confidence events
         # Increase threshold to reduce noise
         events = [e for e in events if e['confidence'] >= 0.30]
-        self.logger.debug(f"After confidence filtering (>= 0.30): {len(events)} events")
+        self.logger.debug("After confidence filtering (>= 0.30): %d events", len(events))
 
         return events
     
@@ -1496,8 +1498,6 @@ class EventExtractor:
         Returns:
             Dict with casualties for each side: {'actor1_deaths': X, 'actor1_injuries': Y, ...}
         """
-        import re
-
         result = {
             'actor1_deaths': None,
             'actor1_injuries': None,
@@ -1567,8 +1567,6 @@ class EventExtractor:
         Returns:
             Expanded event list with reciprocal violence split
         """
-        import re
-
         expanded_events = []
         processed_sentences = set()  # Track sentences that have been split into reciprocal pairs
 
@@ -1773,12 +1771,11 @@ class EventExtractor:
             Enhanced extraction
         """
         # Propagate location if missing OR if current location is invalid (ethnic group name)
-        ethnic_group_names = {'hema', 'lendu', 'hutu', 'tutsi', 'fulani', 'hausa', 'yoruba', 'igbo', 'nuer', 'dinka', 'shona', 'ndebele', 'zulu', 'xhosa'}
         current_location = extraction.get('where', {})
         current_location_text = current_location.get('text', '').lower() if current_location else ''
         
         # Check if current location is invalid (ethnic group name)
-        is_invalid_location = current_location_text in ethnic_group_names
+        is_invalid_location = current_location_text in _ETHNIC_GROUP_NAMES
         
         if (not extraction.get('where') or is_invalid_location) and article_context['locations']:
             # Filter out locations that are actually actor/victim names or ethnic groups
@@ -1789,7 +1786,7 @@ class EventExtractor:
             for loc in article_context['locations']:
                 loc_text = loc.get('text', '').lower()
                 # Exclude if it matches actor/victim or ethnic group names
-                if (loc_text not in ethnic_group_names and 
+                if (loc_text not in _ETHNIC_GROUP_NAMES and 
                     loc_text != actor_name and loc_text != victim_name and
                     actor_name not in loc_text and victim_name not in loc_text):
                     valid_locations.append(loc)
@@ -1878,7 +1875,8 @@ class EventExtractor:
             scored_events.append((event, score))
             # Debug logging
             trigger = event.get('trigger', {})
-            self.logger.debug(f"Salience score for trigger '{trigger.get('word')}' (sent {trigger.get('sentence_index')}): {score}")
+            self.logger.debug("Salience score for trigger '%s' (sent %s): %s",
+                              trigger.get('word'), trigger.get('sentence_index'), score)
 
         # Sort by salience score (descending)
         scored_events.sort(key=lambda x: x[1], reverse=True)
@@ -1896,7 +1894,7 @@ class EventExtractor:
         # Most articles report 1 main event
         if not salient_events and events:
             salient_events = [e for e, s in scored_events[:1]]
-            self.logger.debug(f"No events passed salience threshold, keeping top 1 event only")
+            self.logger.debug("No events passed salience threshold, keeping top 1 event only")
 
         return salient_events
 
@@ -2314,7 +2312,7 @@ class EventExtractor:
                             current[key] = value
                             current['named_victim'] = True
                         # Special case: casualties - take if higher/more complete
-                        elif key in ['deaths', 'injuries'] and value:
+                        elif key in {'deaths', 'injuries'} and value:
                             if not current.get(key) or value > current.get(key):
                                 current[key] = value
 
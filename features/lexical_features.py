@@ -1,28 +1,41 @@
-from typing import List, Dict, Set, Optional, Tuple
+from typing import List, Dict, Set, Optional, Tuple, Iterable
 from collections import Counter, defaultdict
 import numpy as np
 import re
 import logging
 
+
+def _count_terms(tokens: List[str], terms: Set[str]) -> int:
+    """Count tokens that appear in a term set (membership tests run in C)."""
+    return sum(map(terms.__contains__, tokens))
+
+
 class LexicalFeatureExtractor:
     """
     Enhanced lexical feature extractor for African news and violent event analysis.
     Extracts comprehensive linguistic features for ML models.
     """
     
-    def __init__(self, violence_lexicon: List[str] = None, enable_logging: bool = False):
+    def __init__(self, violence_lexicon: Iterable[str] = None, enable_logging: bool = False):
         """
         Initialize enhanced feature extractor.
         
         Args:
-            violence_lexicon: List of violence-related terms
+            violence_lexicon: Violence-related terms (stored as a frozenset)
             enable_logging: Enable debug logging
         """
         self.logger = logging.getLogger(__name__) if enable_logging else None
-        self.violence_lexicon = violence_lexicon or self._default_violence_lexicon()
+        self.violence_lexicon = frozenset(violence_lexicon or self._default_violence_lexicon())
         
         # Initialize specialized lexicons
         self._initialize_lexicons()
+
+        # Multi-word terms are matched against the joined sentence text;
+        # collect them once instead of rescanning every lexicon per sentence
+        self._multiword_actor_terms = [t for t in self.actor_terms if ' ' in t]
+        self._multiword_african_countries = [t for t in self.african_countries if ' ' in t]
+        self._multiword_african_cities = [t for t in self.african_cities if ' ' in t]
+        self._multiword_african_organizations = [t for t in self.african_organizations if ' ' in t]
         
         # Compile regex patterns for efficiency
         self._compile_patterns()
@@ -147,18 +160,22 @@ class LexicalFeatureExtractor:
             Feature dictionary with comprehensive linguistic features
         """
         if self.logger:
-            self.logger.debug(f"Extracting features from {len(tokens)} tokens")
+            self.logger.debug("Extracting features from %d tokens", len(tokens))
         
         features = {}
+
+        # Lowercase once; the lexicon-based extractors all match on this
+        lower_tokens = [t.lower() for t in tokens]
+        text_lower = ' '.join(lower_tokens)
         
         # Basic statistics
         features.update(self._extract_basic_statistics(tokens))
         
         # Violence-related features
-        features.update(self._extract_violence_features(tokens))
+        features.update(self._extract_violence_features(lower_tokens, text_lower))
         
         # African context features
-        features.update(self._extract_african_context_features(tokens))
+        features.update(self._extract_african_context_features(lower_tokens, text_lower))
         
         # Linguistic features
         features.update(self._extract_linguistic_features(tokens, text))
@@ -167,10 +184,10 @@ class LexicalFeatureExtractor:
         features.update(self._extract_statistical_features(tokens))
         
         # Temporal and intensity features
-        features.update(self._extract_temporal_intensity_features(tokens))
+        features.update(self._extract_temporal_intensity_features(lower_tokens))
         
         # Sentiment features
-        features.update(self._extract_sentiment_features(tokens))
+        features.update(self._extract_sentiment_features(lower_tokens))
         
         return features
     
@@ -199,11 +216,11 @@ class LexicalFeatureExtractor:
         
         return features
     
-    def _extract_violence_features(self, tokens: List[str]) -> Dict:
-        """Extract violence-related features."""
+    def _extract_violence_features(self, lower_tokens: List[str], text_lower: str) -> Dict:
+        """Extract violence-related features from lowercased tokens."""
         features = {}
         
-        if not tokens:
+        if not lower_tokens:
             return {
                 'violence_term_count': 0,
                 'violence_term_ratio': 0.0,
@@ -218,24 +235,20 @@ class LexicalFeatureExtractor:
                 'violence_intensity': 0.0
             }
         
-        # Convert to lowercase for matching
-        lower_tokens = [t.lower() for t in tokens]
-        
         # Violence term counts
-        violence_count = sum(1 for t in lower_tokens if t in self.violence_lexicon)
-        death_count = sum(1 for t in lower_tokens if t in self.death_terms)
-        weapon_count = sum(1 for t in lower_tokens if t in self.weapon_terms)
-        actor_count = sum(1 for t in lower_tokens if t in self.actor_terms)
-        violence_verb_count = sum(1 for t in lower_tokens if t in self.violence_verbs)
+        violence_count = _count_terms(lower_tokens, self.violence_lexicon)
+        death_count = _count_terms(lower_tokens, self.death_terms)
+        weapon_count = _count_terms(lower_tokens, self.weapon_terms)
+        actor_count = _count_terms(lower_tokens, self.actor_terms)
+        violence_verb_count = _count_terms(lower_tokens, self.violence_verbs)
         
         # Also check for multi-word terms
-        text_lower = ' '.join(lower_tokens)
-        for term in self.actor_terms:
-            if ' ' in term and term in text_lower:
+        for term in self._multiword_actor_terms:
+            if term in text_lower:
                 actor_count += 1
         
         features['violence_term_count'] = violence_count
-        features['violence_term_ratio'] = violence_count / len(tokens)
+        features['violence_term_ratio'] = violence_count / len(lower_tokens)
         features['death_term_count'] = death_count
         features['weapon_term_count'] = weapon_count
         features['actor_term_count'] = actor_count
@@ -253,15 +266,15 @@ class LexicalFeatureExtractor:
             weapon_count * 2 +  # Weapons indicate capability
             actor_count * 1.5 +  # Actors indicate agency
             violence_verb_count * 1  # Verbs indicate action
-        ) / len(tokens)
+        ) / len(lower_tokens)
         
         return features
     
-    def _extract_african_context_features(self, tokens: List[str]) -> Dict:
-        """Extract African context features."""
+    def _extract_african_context_features(self, lower_tokens: List[str], text_lower: str) -> Dict:
+        """Extract African context features from lowercased tokens."""
         features = {}
         
-        if not tokens:
+        if not lower_tokens:
             return {
                 'african_country_count': 0,
                 'african_city_count': 0,
@@ -270,23 +283,20 @@ class LexicalFeatureExtractor:
                 'african_context_ratio': 0.0
             }
         
-        lower_tokens = [t.lower() for t in tokens]
-        
         # Count African entities (including multi-word terms)
-        text_lower = ' '.join(lower_tokens)
-        country_count = sum(1 for t in lower_tokens if t in self.african_countries)
-        city_count = sum(1 for t in lower_tokens if t in self.african_cities)
-        org_count = sum(1 for t in lower_tokens if t in self.african_organizations)
+        country_count = _count_terms(lower_tokens, self.african_countries)
+        city_count = _count_terms(lower_tokens, self.african_cities)
+        org_count = _count_terms(lower_tokens, self.african_organizations)
         
         # Also check for multi-word African terms
-        for term in self.african_countries:
-            if ' ' in term and term in text_lower:
+        for term in self._multiword_african_countries:
+            if term in text_lower:
                 country_count += 1
-        for term in self.african_cities:
-            if ' ' in term and term in text_lower:
+        for term in self._multiword_african_cities:
+            if term in text_lower:
                 city_count += 1
-        for term in self.african_organizations:
-            if ' ' in term and term in text_lower:
+        for term in self._multiword_african_organizations:
+            if term in text_lower:
                 org_count += 1
         
         # Check for "Boko Haram" specifically (case sensitive in original tokens)
@@ -299,7 +309,7 @@ class LexicalFeatureExtractor:
         features['african_city_count'] = city_count
         features['african_org_count'] = org_count
         features['has_african_context'] = (country_count + city_count + org_count) > 0
-        features['african_context_ratio'] = (country_count + city_count + org_count) / len(tokens)
+        features['african_context_ratio'] = (country_count + city_count + org_count) / len(lower_tokens)
         
         return features
     
@@ -377,11 +387,11 @@ class LexicalFeatureExtractor:
         
         return features
     
-    def _extract_temporal_intensity_features(self, tokens: List[str]) -> Dict:
-        """Extract temporal and intensity features."""
+    def _extract_temporal_intensity_features(self, lower_tokens: List[str]) -> Dict:
+        """Extract temporal and intensity features from lowercased tokens."""
         features = {}
         
-        if not tokens:
+        if not lower_tokens:
             return {
                 'temporal_term_count': 0,
                 'intensity_term_count': 0,
@@ -391,27 +401,25 @@ class LexicalFeatureExtractor:
                 'intensity_ratio': 0.0
             }
         
-        lower_tokens = [t.lower() for t in tokens]
-        
         # Temporal markers
-        temporal_count = sum(1 for t in lower_tokens if t in self.temporal_terms)
+        temporal_count = _count_terms(lower_tokens, self.temporal_terms)
         features['temporal_term_count'] = temporal_count
         features['has_temporal_markers'] = temporal_count > 0
-        features['temporal_ratio'] = temporal_count / len(tokens)
+        features['temporal_ratio'] = temporal_count / len(lower_tokens)
         
         # Intensity markers
-        intensity_count = sum(1 for t in lower_tokens if t in self.intensity_terms)
+        intensity_count = _count_terms(lower_tokens, self.intensity_terms)
         features['intensity_term_count'] = intensity_count
         features['has_intensity_markers'] = intensity_count > 0
-        features['intensity_ratio'] = intensity_count / len(tokens)
+        features['intensity_ratio'] = intensity_count / len(lower_tokens)
         
         return features
     
-    def _extract_sentiment_features(self, tokens: List[str]) -> Dict:
-        """Extract sentiment-related features."""
+    def _extract_sentiment_features(self, lower_tokens: List[str]) -> Dict:
+        """Extract sentiment-related features from lowercased tokens."""
         features = {}
         
-        if not tokens:
+        if not lower_tokens:
             return {
                 'negative_term_count': 0,
                 'positive_term_count': 0,
@@ -420,11 +428,9 @@ class LexicalFeatureExtractor:
                 'has_positive_sentiment': False
             }
         
-        lower_tokens = [t.lower() for t in tokens]
-        
         # Sentiment term counts
-        negative_count = sum(1 for t in lower_tokens if t in self.negative_terms)
-        positive_count = sum(1 for t in lower_tokens if t in self.positive_terms)
+        negative_count = _count_terms(lower_tokens, self.negative_terms)
+        positive_count = _count_terms(lower_tokens, self.positive_terms)
         
         features['negative_term_count'] = negative_count
         features['positive_term_count'] = positive_count
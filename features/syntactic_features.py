@@ -1,5 +1,5 @@
 from typing import List, Dict
-from collections import Counter
+from collections import Counter, deque
 
 class SyntacticFeatureExtractor:
     """
@@ -32,7 +32,7 @@ class SyntacticFeatureExtractor:
         features['num_adj'] = pos_counter.get('JJ', 0) + pos_counter.get('JJR', 0)
         
         # Verb patterns
-        lemmas = [t.get('lemma', '').lower() for t in tokens]
+        lemmas = {t.get('lemma', '').lower() for t in tokens}
         features['has_violence_verb'] = any(v in lemmas for v in self.violence_verbs)
         
         # Dependency patterns
@@ -105,8 +105,6 @@ class SyntacticFeatureExtractor:
             graph[dep_idx].append((gov, f"{dep_type}_inv"))
         
         # BFS to find path
-        from collections import deque
-        
         queue = deque([(source_idx, [])])
         visited = {source_idx}
         
@@ -1,16 +1,67 @@
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Optional, Callable
+from collections import Counter
+import functools
 import logging
 from pathlib import Path
 
 # Import all components
 from preprocessing.text_cleaner import TextCleaner
 from preprocessing.sentence_splitter import SentenceSplitter
-from stanford_nlp.corenlp_wrapper import CoreNLPWrapper
+from stanford_nlp.corenlp_wrapper import CoreNLPWrapper, DEFAULT_ANNOTATORS, DOCUMENT_SEPARATOR
 from features.lexical_features import LexicalFeatureExtractor
 from features.syntactic_features import SyntacticFeatureExtractor
 from domain.violence_lexicon import ViolenceLexicon
 from domain.african_ner import AfricanNER
 
+
+@functools.lru_cache(maxsize=1)
+def _violence_terms() -> FrozenSet[str]:
+    """Violence lexicon terms, built once per process and shared by all pipelines."""
+    return frozenset(ViolenceLexicon().all_terms)
+
+
+class _ArticleFeatureAccumulator:
+    """
+    Online accumulator for article-level features.
+
+    Sentences are added one at a time so article features can be computed
+    without holding every sentence result in memory.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.num_sentences = 0
+        self.violence_sentences = 0
+        self.entity_types = Counter()
+
+    def add(self, sentence: Dict):
+        """Fold one processed sentence into the counters."""
+        self.num_sentences += 1
+        if sentence.get('is_violence_sentence', False):
+            self.violence_sentences += 1
+        self.entity_types.update(e['type'] for e in sentence.get('entities', ()))
+
+    def finalize(self) -> Dict:
+        """Return the article-level feature dictionary."""
+        features = {}
+
+        features['num_violence_sentences'] = self.violence_sentences
+        features['violence_sentence_ratio'] = (
+            self.violence_sentences / self.num_sentences if self.num_sentences else 0
+        )
+
+        entity_types = self.entity_types
+        features['entity_counts'] = dict(entity_types)
+
+        # Check for actors
+        features['has_organization'] = 'ORGANIZATION' in entity_types
+        features['has_person'] = 'PERSON' in entity_types
+        features['has_location'] = 'LOCATION' in entity_types
+        features['has_date'] = 'DATE' in entity_types
+
+        return features
+
+
 class ViolentEventNLPPipeline:
     """
     Complete NLP pipeline for violent event processing.
@@ -32,16 +83,49 @@ class ViolentEventNLPPipeline:
         self.logger.info("Initializing NLP pipeline components...")
 
         self.text_cleaner = TextCleaner()
+        # Cleaning is deterministic, so re-processed articles (re-runs,
+        # resumed batches) reuse the earlier result; bounded to cap memory
+        self._clean = functools.lru_cache(maxsize=1024)(self.text_cleaner.clean)
         self.sentence_splitter = SentenceSplitter()
 
         # Stanford CoreNLP (requires server running)
-        corenlp_path = corenlp_config['path']
+        corenlp_path = corenlp_config.get('path', '')
         memory = corenlp_config.get('memory', '4g')
-        self.corenlp = CoreNLPWrapper(corenlp_path, memory)
+
+        # Coreference is expensive; request it only when configured
+        self.use_coref = corenlp_config.get('use_coref', False)
+        annotators = [a.strip() for a in
+                      corenlp_config.get('annotators', DEFAULT_ANNOTATORS).split(',')
+                      if a.strip() and a.strip() != 'coref']
+        if self.use_coref:
+            annotators.append('coref')
+
+        # A configured url points all pipelines (e.g. batch workers) at one
+        # shared server instead of the local installation. Repeated texts
+        # (re-runs, duplicated articles) are served from an LRU cache.
+        self.corenlp = CoreNLPWrapper(corenlp_path, memory, ','.join(annotators),
+                                      server_url=corenlp_config.get('url'),
+                                      cache_size=corenlp_config.get('cache_size', 256))
+
+        # Sentence source: CoreNLP's own sentence splitting over the whole
+        # article (default), or SentenceSplitter with one request per sentence
+        self.use_server_sentences = corenlp_config.get('use_server_sentences', True)
+
+        # Retry sentence-by-sentence when whole-article annotation fails
+        self.allow_fallback = corenlp_config.get('allow_fallback', False)
+
+        # Keeping the raw text doubles the memory held by each result, so it
+        # is only stored when explicitly requested
+        processing_config = self.config.get('processing', {})
+        self.keep_original_text = processing_config.get('keep_original_text', False)
+
+        # Syntactic features are only computed for sentences containing
+        # violence terms unless this is disabled
+        self.fast_skip_non_violence = processing_config.get('fast_skip_non_violence', True)
         
         # Feature extractors
         self.violence_lexicon = ViolenceLexicon()
-        self.lexical_features = LexicalFeatureExtractor(list(self.violence_lexicon.all_terms))
+        self.lexical_features = LexicalFeatureExtractor(_violence_terms())
         self.syntactic_features = SyntacticFeatureExtractor()
         
         # Domain-specific NER
@@ -63,70 +147,221 @@ class ViolentEventNLPPipeline:
             raise KeyError("Missing 'stanford_corenlp' configuration section")
 
         corenlp_config = self.config['stanford_corenlp']
-        if 'path' not in corenlp_config:
-            raise KeyError("Missing 'stanford_corenlp.path' configuration value")
+        if 'path' not in corenlp_config and 'url' not in corenlp_config:
+            raise KeyError("Missing 'stanford_corenlp.path' (or 'url') configuration value")
 
         return corenlp_config
     
-    def process_article(self, article_text: str, article_id: str = None) -> Dict:
+    def process_article(self, article_text: str, article_id: str = None,
+                        sentence_sink: Optional[Callable[[Dict], None]] = None,
+                        include_metadata: bool = True) -> Dict:
         """
         Process a complete article through the pipeline.
 
         Args:
             article_text: Raw article text
             article_id: Article identifier
+            sentence_sink: Optional callback receiving each processed sentence.
+                When given, sentences are streamed to it instead of being
+                collected in result['sentences'].
+            include_metadata: Whether to run metadata extraction over the
+                cleaned text. Callers that never read result['metadata'] can
+                pass False to skip the extra regex passes.
 
         Returns:
             Processed article with all annotations
         """
         self.logger.info(f"Processing article: {article_id}")
 
-        result = {
-            'article_id': article_id,
-            'original_text': article_text,
-            'sentences': []
-        }
+        result = self._new_result(article_text, article_id)
 
         try:
-            # Step 1: Clean text
-            self.logger.debug("Cleaning text...")
-            cleaned_text = self.text_cleaner.clean(article_text)
-            result['cleaned_text'] = cleaned_text
-
-            # Extract metadata
-            metadata = self.text_cleaner.extract_metadata(cleaned_text)
-            result['metadata'] = metadata
+            # Step 1: Clean text and extract metadata
+            cleaned_text = self._prepare_text(result, article_text, include_metadata)
 
             # Step 2: Annotate entire article with Stanford CoreNLP
             # This enables coreference resolution across sentences
             self.logger.debug("Annotating article with Stanford CoreNLP...")
-            full_annotation = self.corenlp.annotate(cleaned_text)
+            full_annotation = self._annotate_article(cleaned_text)
+
+            # Step 3: Sentence processing and article-level features
+            self._process_annotation(result, full_annotation, sentence_sink)
 
-            # Extract sentences from CoreNLP output
-            sentences = full_annotation.get('sentences', [])
-            result['num_sentences'] = len(sentences)
+        except Exception as e:
+            self.logger.error(f"Error processing article: {e}")
+            result['error'] = str(e)
+
+        return result
+
+    def process_articles_batched(self, articles: List[Dict],
+                                 batch_chars: int = 200_000) -> List[Dict]:
+        """
+        Process several articles, annotating them with one CoreNLP request
+        per batch instead of one request per article.
 
-            # Extract coreference chains if available
-            if 'coref_chains' in full_annotation:
-                result['coref_chains'] = full_annotation['coref_chains']
-                self.logger.debug(f"Extracted {len(full_annotation['coref_chains'])} coreference chains")
+        Cleaned articles are collected until the batch reaches
+        ``batch_chars`` characters and annotated with
+        CoreNLPWrapper.annotate_batch. Keep ``batch_chars``
+        well below the server's request size limit (1M characters by default).
+        If a batch cannot be annotated or partitioned cleanly, its articles
+        are annotated one by one instead.
 
-            # Process each sentence from CoreNLP
-            for sent_ann in sentences:
-                sent_idx = sent_ann.get('index', 0)
-                sentence_result = self._process_corenlp_sentence(sent_ann, sent_idx)
+        With ``use_coref`` enabled every article is annotated in its own
+        request: CoreNLP resolves coreference over the whole request, so a
+        batch would let chains link mentions across articles.
+
+        Args:
+            articles: Article dicts with 'id' and 'text'
+            batch_chars: Maximum cleaned characters per CoreNLP request
+
+        Returns:
+            One processed article result per input article, in input order
+        """
+        results = []
+        batch = []
+        batch_size = 0
+
+        for article in articles:
+            result = self._new_result(article['text'], article['id'])
+            results.append(result)
+            try:
+                cleaned_text = self._prepare_text(result, article['text'], True)
+            except Exception as e:
+                self.logger.error(f"Error processing article: {e}")
+                result['error'] = str(e)
+                continue
+
+            if batch and batch_size + len(cleaned_text) > batch_chars:
+                self._process_batch(batch)
+                batch, batch_size = [], 0
+            batch.append((result, cleaned_text))
+            batch_size += len(cleaned_text) + len(DOCUMENT_SEPARATOR)
+
+        if batch:
+            self._process_batch(batch)
+
+        return results
+
+    def _new_result(self, article_text: str, article_id: str) -> Dict:
+        """Create the result skeleton for one article."""
+        result = {
+            'article_id': article_id,
+            'sentences': []
+        }
+        if self.keep_original_text:
+            result['original_text'] = article_text
+        return result
+
+    def _prepare_text(self, result: Dict, article_text: str,
+                      include_metadata: bool) -> str:
+        """Clean article text, recording it (and metadata) on the result."""
+        self.logger.debug("Cleaning text...")
+        cleaned_text = self._clean(article_text)
+        result['cleaned_text'] = cleaned_text
+
+        if include_metadata:
+            result['metadata'] = self.text_cleaner.extract_metadata(cleaned_text)
+
+        return cleaned_text
+
+    def _process_annotation(self, result: Dict, full_annotation: Dict,
+                            sentence_sink: Optional[Callable[[Dict], None]] = None):
+        """Process annotated sentences and fill in article-level results."""
+        # Extract sentences from CoreNLP output
+        sentences = full_annotation.get('sentences', [])
+        result['num_sentences'] = len(sentences)
+
+        # Extract coreference chains if requested and available
+        if self.use_coref and 'coref_chains' in full_annotation:
+            result['coref_chains'] = full_annotation['coref_chains']
+            self.logger.debug("Extracted %d coreference chains", len(full_annotation['coref_chains']))
+
+        # Process each sentence from CoreNLP, aggregating article
+        # features as we go
+        accumulator = _ArticleFeatureAccumulator()
+        for sent_ann in sentences:
+            sent_idx = sent_ann.get('index', 0)
+            sentence_result = self._process_corenlp_sentence(sent_ann, sent_idx)
+            accumulator.add(sentence_result)
+            if sentence_sink is None:
                 result['sentences'].append(sentence_result)
+            else:
+                sentence_sink(sentence_result)
+
+        result['article_features'] = accumulator.finalize()
 
-            # Step 3: Article-level features
-            result['article_features'] = self.extract_article_features(result)
+        self.logger.info(f"Article processing complete: {accumulator.num_sentences} sentences")
 
-            self.logger.info(f"Article processing complete: {len(result['sentences'])} sentences")
+    def _process_batch(self, batch: List[tuple]):
+        """
+        Annotate a batch of (result, cleaned_text) pairs with one request.
+
+        Falls back to per-article annotation when sentence-by-sentence mode
+        or coreference is configured, the batch holds a single article, or
+        the combined annotation cannot be split back at the sentinels.
+        """
+        annotations = None
+        # Coreference chains must not span articles, so coref needs one
+        # request per article
+        if self.use_server_sentences and not self.use_coref and len(batch) > 1:
+            try:
+                annotations = self.corenlp.annotate_batch([text for _, text in batch])
+            except Exception as e:
+                self.logger.warning(f"Batch annotation failed ({e}); annotating article by article")
+
+        for i, (result, cleaned_text) in enumerate(batch):
+            try:
+                if annotations is None:
+                    full_annotation = self._annotate_article(cleaned_text)
+                else:
+                    full_annotation = annotations[i]
+                self._process_annotation(result, full_annotation)
+            except Exception as e:
+                self.logger.error(f"Error processing article: {e}")
+                result['error'] = str(e)
+
+    def _annotate_article(self, text: str) -> Dict:
+        """
+        Annotate article text according to the configured sentence source.
+
+        Args:
+            text: Cleaned article text
 
+        Returns:
+            CoreNLP annotation with 'sentences' (and 'coref_chains' when the
+            whole article was annotated in one request)
+        """
+        if not self.use_server_sentences:
+            return self._annotate_sentences(text)
+
+        try:
+            return self.corenlp.annotate(text)
         except Exception as e:
-            self.logger.error(f"Error processing article: {e}")
-            result['error'] = str(e)
+            if not self.allow_fallback:
+                raise
+            self.logger.warning(f"Article annotation failed ({e}); annotating sentence by sentence")
+            return self._annotate_sentences(text)
 
-        return result
+    def _annotate_sentences(self, text: str) -> Dict:
+        """
+        Split text with SentenceSplitter and annotate each sentence separately.
+
+        Coreference chains are not available in this mode.
+
+        Args:
+            text: Cleaned article text
+
+        Returns:
+            CoreNLP-style annotation with re-indexed 'sentences'
+        """
+        sentences = []
+        for sentence_text in self.sentence_splitter.split(text):
+            annotation = self.corenlp.annotate(sentence_text)
+            for sent_ann in annotation.get('sentences', []):
+                sent_ann['index'] = len(sentences)
+                sentences.append(sent_ann)
+
+        return {'sentences': sentences}
 
     def _process_corenlp_sentence(self, sent_ann: Dict, sentence_idx: int) -> Dict:
         """
@@ -137,54 +372,59 @@ class ViolentEventNLPPipeline:
             sentence_idx: Sentence index in article
 
         Returns:
-            Processed sentence with all features
+            Processed sentence with all features. When fast_skip_non_violence
+            is enabled, syntactic_features is empty for non-violence sentences.
         """
-        # Reconstruct sentence text from tokens
+        # Reconstruct sentence text from tokens (the wrapper guarantees 'word')
         tokens = sent_ann.get('tokens', [])
-        sentence_text = ' '.join(t.get('word', '') for t in tokens)
-
-        result = {
-            'index': sentence_idx,
-            'sentence_idx': sentence_idx,
-            'text': sentence_text,
-            'tokens': tokens,
-            'num_tokens': len(tokens)
-        }
+        token_words = [t['word'] for t in tokens]
+        sentence_text = ' '.join(token_words)
 
         try:
-            # Extract entities
-            entities = self.corenlp.get_entities(sent_ann)
-
-            # Enhance with African NER
-            enhanced_entities = self.african_ner.enhance_ner(entities, sentence_text)
-            result['entities'] = enhanced_entities
+            # Extract entities, enhanced with African NER
+            entities = self.african_ner.enhance_ner(
+                self.corenlp.get_entities(sent_ann), sentence_text)
 
             # Extract dependencies
             dependencies = self.corenlp.get_dependencies(sent_ann)
-            result['dependencies'] = dependencies
-
-            # Store basic dependencies in both formats for compatibility
-            result['basicDependencies'] = sent_ann.get('basicDependencies', [])
 
-            # Extract features
-            token_words = [t['word'] for t in tokens]
-
-            # Lexical features
+            # Lexical features decide whether the sentence is violence-related
             lex_features = self.lexical_features.extract_features(token_words)
-            result['lexical_features'] = lex_features
+            is_violence = lex_features.get('violence_term_count', 0) > 0
 
             # Syntactic features
-            syn_features = self.syntactic_features.extract_features(tokens, dependencies)
-            result['syntactic_features'] = syn_features
-
-            # Violence indicators
-            result['is_violence_sentence'] = lex_features.get('violence_term_count', 0) > 0
+            if is_violence or not self.fast_skip_non_violence:
+                syn_features = self.syntactic_features.extract_features(tokens, dependencies)
+            else:
+                syn_features = {}
 
         except Exception as e:
             self.logger.error(f"Error processing CoreNLP sentence {sentence_idx}: {e}")
-            result['error'] = str(e)
-
-        return result
+            return {
+                'index': sentence_idx,
+                'sentence_idx': sentence_idx,
+                'text': sentence_text,
+                'tokens': tokens,
+                'num_tokens': len(tokens),
+                'error': str(e)
+            }
+
+        # Assemble the result in one step once all features are available
+        return {
+            'index': sentence_idx,
+            'sentence_idx': sentence_idx,
+            'text': sentence_text,
+            'tokens': tokens,
+            'num_tokens': len(tokens),
+            'entities': entities,
+            'dependencies': dependencies,
+            # Store basic dependencies in both formats for compatibility
+            'basicDependencies': sent_ann.get('basicDependencies', []),
+            'lexical_features': lex_features,
+            'syntactic_features': syn_features,
+            # Violence indicators
+            'is_violence_sentence': is_violence
+        }
 
     def extract_article_features(self, article_result: Dict) -> Dict:
         """
@@ -196,32 +436,11 @@ class ViolentEventNLPPipeline:
         Returns:
             Article-level features
         """
-        features = {}
-        
-        sentences = article_result.get('sentences', [])
-        
-        # Count violence sentences
-        violence_sentences = sum(1 for s in sentences if s.get('is_violence_sentence', False))
-        features['num_violence_sentences'] = violence_sentences
-        features['violence_sentence_ratio'] = violence_sentences / len(sentences) if sentences else 0
-        
-        # Aggregate entities
-        all_entities = []
-        for sent in sentences:
-            all_entities.extend(sent.get('entities', []))
-        
-        # Count entity types
-        from collections import Counter
-        entity_types = Counter(e['type'] for e in all_entities)
-        features['entity_counts'] = dict(entity_types)
-        
-        # Check for actors
-        features['has_organization'] = entity_types.get('ORGANIZATION', 0) > 0
-        features['has_person'] = entity_types.get('PERSON', 0) > 0
-        features['has_location'] = entity_types.get('LOCATION', 0) > 0
-        features['has_date'] = entity_types.get('DATE', 0) > 0
-        
-        return features
+        accumulator = _ArticleFeatureAccumulator()
+        for sentence in article_result.get('sentences', []):
+            accumulator.add(sentence)
+
+        return accumulator.finalize()
     
     def close(self):
         """Cleanup resources."""
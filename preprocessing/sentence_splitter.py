@@ -1,7 +1,29 @@
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Dict
+from concurrent.futures import ProcessPoolExecutor
 import re
 import logging
 
+# Optional: Aho-Corasick automaton for single-pass vocabulary lookups
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Per-process splitter used by SentenceSplitter.split_batch workers
+_worker_splitter = None
+
+
+def _init_split_worker(splitter: 'SentenceSplitter'):
+    """Install the (pickled) parent splitter in a worker process."""
+    global _worker_splitter
+    _worker_splitter = splitter
+
+
+def _split_in_worker(text: str) -> List[str]:
+    """Split one text with the worker's splitter."""
+    return _worker_splitter.split(text)
+
+
 class SentenceSplitter:
     """
     Enhanced sentence splitter with special handling for abbreviations,
@@ -82,6 +104,18 @@ class SentenceSplitter:
             r'(?<=[.!?])\s+(?=\u2022)'   # Before bullet symbols
         )
         
+        # Smart quotes and dashes mapped to ASCII in one translate pass
+        self.normalization_table = str.maketrans({
+            '\u201c': '"', '\u201d': '"',
+            '\u2018': "'", '\u2019': "'",
+            '\u2014': '-', '\u2013': '-',
+        })
+        
+        # Patterns used when splitting and validating sentences
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.boundary_pattern = re.compile(r'([.!?]+)\s+')
+        self.punct_only_pattern = re.compile(r'^[.!?,\-_\s]+$')
+        
         # Pattern for quotes and dialogue
         self.quote_pattern = re.compile(r'"[^"]*"')
         
@@ -98,6 +132,65 @@ class SentenceSplitter:
             r'\b(?:Al-Shabaab|Boko Haram|ISWAP|ECOWAS|AU|IGAD|SADC|EAC)\b',
             re.IGNORECASE
         )
+        
+        # Everything protected from splitting, in one alternation so the
+        # text is scanned once
+        self.protect_pattern = self._build_protect_pattern()
+        
+        # All vocabulary sets in one automaton (None without pyahocorasick)
+        self.vocabulary_automaton = self._build_vocabulary_automaton()
+    
+    def _build_protect_pattern(self):
+        """
+        Combine abbreviations, quotes, numbers/dates and African names into
+        a single pattern. Abbreviations are tried longest first.
+        """
+        abbreviations = '|'.join(
+            re.escape(abbr) for abbr in sorted(self.abbreviations, key=len, reverse=True)
+        )
+        return re.compile(
+            r'(?P<ABBR>\b(?:' + abbreviations + r')\b)|'
+            r'(?P<QUOTE>' + self.quote_pattern.pattern + r')|'
+            r'(?P<NUM>' + self.number_date_pattern.pattern + r')|'
+            r'(?P<AFR>(?i:' + self.african_name_pattern.pattern + r'))'
+        )
+    
+    def _build_vocabulary_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the abbreviation, African term
+        and violence abbreviation sets, so all of them can be found in one
+        pass over a text. Returns None if pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        
+        # A term may belong to several sets
+        term_tags = {}
+        for tag, terms in (('abbreviations', self.abbreviations),
+                           ('african_terms', self.african_terms),
+                           ('violence_abbreviations', self.violence_abbreviations)):
+            for term in terms:
+                term_tags.setdefault(term, set()).add(tag)
+        
+        automaton = ahocorasick.Automaton()
+        for term, tags in term_tags.items():
+            automaton.add_word(term, (term, frozenset(tags)))
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_vocabulary(self, text: str) -> Dict[str, Set[str]]:
+        """Find which vocabulary terms occur in text (as substrings), per set."""
+        found = {'abbreviations': set(), 'african_terms': set(), 'violence_abbreviations': set()}
+        
+        if self.vocabulary_automaton is None:
+            for tag in found:
+                found[tag] = {term for term in getattr(self, tag) if term in text}
+            return found
+        
+        for _, (term, tags) in self.vocabulary_automaton.iter(text):
+            for tag in tags:
+                found[tag].add(term)
+        return found
     
     def split(self, text: str) -> List[str]:
         """
@@ -113,123 +206,95 @@ class SentenceSplitter:
             return []
         
         if self.logger:
-            self.logger.debug(f"Splitting text of length {len(text)}")
+            self.logger.debug("Splitting text of length %d", len(text))
         
         # Step 1: Preprocess text
         processed_text = self._preprocess_text(text)
         
-        # Step 2: Protect special patterns
-        protected_text, replacements = self._protect_patterns(processed_text)
-        
-        # Step 3: Split on sentence boundaries
-        sentences = self._split_sentences(protected_text)
-        
-        # Step 4: Restore protected patterns
-        sentences = self._restore_patterns(sentences, replacements)
+        # Step 2: Split on sentence boundaries outside protected patterns
+        sentences = self._split_sentences(processed_text)
         
-        # Step 5: Clean and validate sentences
+        # Step 3: Clean and validate sentences
         sentences = self._clean_and_validate(sentences)
         
         if self.logger:
-            self.logger.debug(f"Split into {len(sentences)} sentences")
+            self.logger.debug("Split into %d sentences", len(sentences))
         
         return sentences
     
+    def split_batch(self, texts: List[str], n_workers: Optional[int] = None,
+                    chunksize: int = 16) -> List[List[str]]:
+        """
+        Split many texts, optionally across worker processes.
+        
+        Splitting is pure-Python regex work that holds the GIL, so
+        parallelism uses processes; each worker receives one copy of this
+        splitter (including any added abbreviations) when it starts.
+        
+        Args:
+            texts: Input texts
+            n_workers: Number of worker processes (None or 1 splits in
+                this process)
+            chunksize: Texts sent to a worker per task
+            
+        Returns:
+            List of sentence lists, in input order
+        """
+        if not n_workers or n_workers <= 1 or len(texts) <= 1:
+            return [self.split(text) for text in texts]
+        
+        with ProcessPoolExecutor(max_workers=n_workers,
+                                 initializer=_init_split_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_split_in_worker, texts, chunksize=chunksize))
+    
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for better sentence splitting."""
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = self.whitespace_pattern.sub(' ', text.strip())
         
-        # Handle common encoding issues
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-        text = text.replace('—', '-').replace('–', '-')
+        # Handle common encoding issues (smart quotes and dashes)
+        text = text.translate(self.normalization_table)
         
         return text
     
-    def _protect_patterns(self, text: str) -> tuple:
-        """Protect special patterns from being split."""
-        protected_text = text
-        replacements = {}
-        replacement_id = 0
-        
-        # Protect abbreviations (be more careful about word boundaries)
-        for abbr in self.abbreviations:
-            # Use word boundaries to avoid partial matches
-            pattern = re.compile(r'\b' + re.escape(abbr) + r'\b')
-            if pattern.search(protected_text):
-                placeholder = f"<ABBR_{replacement_id}>"
-                protected_text = pattern.sub(placeholder, protected_text)
-                replacements[placeholder] = abbr
-                replacement_id += 1
-        
-        # Protect quotes and dialogue
-        quote_matches = self.quote_pattern.findall(protected_text)
-        for quote in quote_matches:
-            placeholder = f"<QUOTE_{replacement_id}>"
-            protected_text = protected_text.replace(quote, placeholder)
-            replacements[placeholder] = quote
-            replacement_id += 1
-        
-        # Protect numbers and dates
-        number_matches = self.number_date_pattern.findall(protected_text)
-        for number in number_matches:
-            placeholder = f"<NUM_{replacement_id}>"
-            protected_text = protected_text.replace(number, placeholder)
-            replacements[placeholder] = number
-            replacement_id += 1
-        
-        # Protect African names and organizations
-        african_matches = self.african_name_pattern.findall(protected_text)
-        for name in african_matches:
-            placeholder = f"<AFR_{replacement_id}>"
-            protected_text = protected_text.replace(name, placeholder)
-            replacements[placeholder] = name
-            replacement_id += 1
-        
-        return protected_text, replacements
-    
     def _split_sentences(self, text: str) -> List[str]:
-        """Split text into sentences using enhanced patterns."""
-        # Use a more flexible approach that handles protected text
-        # Split on sentence boundaries: . ! ? followed by space
-        sentence_boundary = re.compile(r'([.!?]+)\s+')
+        """
+        Split text into sentences in a single left-to-right pass.
         
-        # Split the text
-        parts = sentence_boundary.split(text)
+        Protected patterns (abbreviations, quotes, numbers/dates, African
+        names) are located up front as spans; a boundary (. ! ? followed by
+        whitespace) is only used when it does not start inside one of them.
+        Sentences are sliced straight from the text, so no placeholder copy
+        of the text is built or restored.
+        """
+        spans = [match.span() for match in self.protect_pattern.finditer(text)]
+        span_idx = 0
         
         sentences = []
-        current_sentence = ""
+        start = 0
         
-        for i, part in enumerate(parts):
-            current_sentence += part
+        for match in self.boundary_pattern.finditer(text):
+            position = match.start()
+            
+            # Advance past protected spans that end before this boundary
+            while span_idx < len(spans) and spans[span_idx][1] <= position:
+                span_idx += 1
+            if span_idx < len(spans) and spans[span_idx][0] <= position:
+                continue
             
-            # If this part is just punctuation and there's more text, we have a sentence boundary
-            if (re.match(r'^[.!?]+$', part) and 
-                i + 1 < len(parts) and 
-                len(current_sentence.strip()) > 0):
-                
-                sentences.append(current_sentence.strip())
-                current_sentence = ""
+            sentence = text[start:match.end(1)].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
         
         # Add any remaining text
-        if current_sentence.strip():
-            sentences.append(current_sentence.strip())
+        remaining = text[start:].strip()
+        if remaining:
+            sentences.append(remaining)
         
         return sentences
     
-    def _restore_patterns(self, sentences: List[str], replacements: dict) -> List[str]:
-        """Restore protected patterns in sentences."""
-        restored_sentences = []
-        
-        for sentence in sentences:
-            restored_sentence = sentence
-            for placeholder, original in replacements.items():
-                restored_sentence = restored_sentence.replace(placeholder, original)
-            restored_sentences.append(restored_sentence)
-        
-        return restored_sentences
-    
     def _clean_and_validate(self, sentences: List[str]) -> List[str]:
         """Clean and validate sentences."""
         valid_sentences = []
@@ -242,27 +307,21 @@ class SentenceSplitter:
             if not sentence:
                 continue
             
-            # Skip very short sentences (likely fragments)
-            word_count = len(sentence.split())
+            # Skip very short sentences (likely fragments). Whitespace was
+            # collapsed to single spaces in _preprocess_text, so counting
+            # spaces gives the word count without building a word list
+            word_count = sentence.count(' ') + 1
             if word_count < self.min_sentence_length:
                 if self.logger:
-                    self.logger.debug(f"Skipping short sentence: '{sentence}' ({word_count} words)")
+                    self.logger.debug("Skipping short sentence: '%s' (%d words)", sentence, word_count)
                 continue
             
             # Skip sentences that are just punctuation
-            if re.match(r'^[.!?,\-_\s]+$', sentence):
+            if self.punct_only_pattern.match(sentence):
                 if self.logger:
-                    self.logger.debug(f"Skipping punctuation-only sentence: '{sentence}'")
+                    self.logger.debug("Skipping punctuation-only sentence: '%s'", sentence)
                 continue
             
-            # Skip sentences that start with lowercase (likely fragments)
-            if sentence and sentence[0].islower() and not sentence[0].isalpha():
-                # Allow sentences starting with quotes or numbers
-                if not (sentence.startswith('"') or sentence[0].isdigit()):
-                    if self.logger:
-                        self.logger.debug(f"Skipping lowercase-start sentence: '{sentence}'")
-                    continue
-            
             valid_sentences.append(sentence)
         
         return valid_sentences
@@ -270,24 +329,39 @@ class SentenceSplitter:
     def add_abbreviation(self, abbreviation: str):
         """Add a new abbreviation to the set."""
         self.abbreviations.add(abbreviation)
+        self.protect_pattern = self._build_protect_pattern()
+        self.vocabulary_automaton = self._build_vocabulary_automaton()
         if self.logger:
-            self.logger.debug(f"Added abbreviation: {abbreviation}")
+            self.logger.debug("Added abbreviation: %s", abbreviation)
     
     def add_african_term(self, term: str):
         """Add a new African term to the set."""
         self.african_terms.add(term)
+        self.vocabulary_automaton = self._build_vocabulary_automaton()
         if self.logger:
-            self.logger.debug(f"Added African term: {term}")
+            self.logger.debug("Added African term: %s", term)
     
     def get_statistics(self, text: str) -> dict:
         """Get statistics about the text and splitting process."""
         sentences = self.split(text)
+        vocabulary = self._find_vocabulary(text)
+        
+        # Sentence length statistics in a single pass
+        total_words = 0
+        shortest = longest = 0
+        for sentence in sentences:
+            word_count = sentence.count(' ') + 1
+            total_words += word_count
+            if not shortest or word_count < shortest:
+                shortest = word_count
+            if word_count > longest:
+                longest = word_count
         
         return {
             'total_sentences': len(sentences),
-            'avg_sentence_length': sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0,
-            'shortest_sentence': min(len(s.split()) for s in sentences) if sentences else 0,
-            'longest_sentence': max(len(s.split()) for s in sentences) if sentences else 0,
-            'abbreviations_found': len([abbr for abbr in self.abbreviations if abbr in text]),
-            'african_terms_found': len([term for term in self.african_terms if term in text])
+            'avg_sentence_length': total_words / len(sentences) if sentences else 0,
+            'shortest_sentence': shortest,
+            'longest_sentence': longest,
+            'abbreviations_found': len(vocabulary['abbreviations']),
+            'african_terms_found': len(vocabulary['african_terms'])
         }
@@ -13,59 +13,135 @@ import sys
 import csv
 import json
 import re
+import argparse
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from pipeline import ViolentEventNLPPipeline
 from event_extraction import EventExtractor
 from domain.violence_lexicon import ViolenceLexicon
 from domain.african_ner import AfricanNER
 
+# orjson serialises rows several times faster than the standard library;
+# fall back to json when it is not installed
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# "## Article X:" marker; followed by "<type>\n" it starts an article, which
+# runs to the next marker
+_ARTICLE_HEADER = re.compile(r'## Article \d+:(?:([^\n]+)\n)?')
+
+# Metadata line prefixes and the article fields they fill
+_META_PREFIXES = (
+    ('**Source:**', 'source'),
+    ('**Date:**', 'date'),
+    ('**Location:**', 'location'),
+)
+
+# Per-process pipeline and extractor used by _extract_article_events
+_worker_pipeline = None
+_worker_extractor = None
+_worker_cache_dir = None
+_worker_cache_salt = b''
+
+
+def _init_worker(config, cache_dir=None):
+    """Build the NLP pipeline and event extractor once per process."""
+    global _worker_pipeline, _worker_extractor, _worker_cache_dir, _worker_cache_salt
+    _worker_pipeline = ViolentEventNLPPipeline(config)
+    _worker_extractor = EventExtractor(ViolenceLexicon(), AfricanNER())
+    _worker_cache_dir = Path(cache_dir) if cache_dir else None
+    # Annotations depend on the pipeline config, so it is part of the key
+    _worker_cache_salt = json.dumps(config, sort_keys=True).encode('utf-8')
+
+
+def _annotate_article(article_id, body):
+    """
+    Run an article body through the NLP pipeline, reusing the pickled
+    annotation of an identical body (and config) when caching is enabled.
+    """
+    if _worker_cache_dir is None:
+        return _worker_pipeline.process_article(body, article_id)
+
+    key = hashlib.sha1(_worker_cache_salt + body.encode('utf-8')).hexdigest()
+    cache_file = _worker_cache_dir / f"{key}.pkl"
+    if cache_file.exists():
+        article_annotation = pickle.loads(cache_file.read_bytes())
+        article_annotation['article_id'] = article_id
+        return article_annotation
+
+    article_annotation = _worker_pipeline.process_article(body, article_id)
+    # process_article reports failures (e.g. a CoreNLP timeout) in the
+    # result instead of raising; never cache those, so a re-run retries
+    if 'error' in article_annotation:
+        return article_annotation
+
+    # Write to a temporary name first so concurrent workers never read a
+    # partially written file
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_bytes(pickle.dumps(article_annotation, pickle.HIGHEST_PROTOCOL))
+    tmp_file.replace(cache_file)
+    return article_annotation
+
+
+def _extract_article_events(item):
+    """Run one (article_id, article) pair through the pipeline and extractor."""
+    article_id, article = item
+
+    # Process through NLP pipeline
+    article_annotation = _annotate_article(article_id, article['body'])
+
+    # Extract events (pass article date for date normalization)
+    article_date = article.get('date', '')
+    return _worker_extractor.extract_events(article_annotation, article_date)
+
 
 def parse_articles(file_path):
     """Parse articles from markdown file."""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Split by article headers using regex to find "## Article X:"
+    # Split at the article headers ("## Article X:"); each article's
+    # content runs from its header to the next one
     articles = []
-    article_pattern = r'## Article \d+:([^\n]+)\n(.*?)(?=## Article \d+:|$)'
-    matches = re.finditer(article_pattern, content, re.DOTALL)
+    headers = list(_ARTICLE_HEADER.finditer(content))
 
-    for match in matches:
-        article_type = match.group(1).strip()
-        article_content = match.group(2).strip()
+    for i, header in enumerate(headers):
+        if header.group(1) is None:
+            continue
+        article_type = header.group(1).strip()
+        content_end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        article_content = content[header.end():content_end].strip()
 
-        # Parse metadata and body
-        lines = article_content.split('\n')
         article_data = {
             'type': article_type,
             'raw_text': article_content
         }
 
-        # Extract metadata
-        for line in lines:
-            if line.startswith('### '):
-                article_data['title'] = line.replace('### ', '').strip()
-            elif line.startswith('**Source:**'):
-                article_data['source'] = line.replace('**Source:**', '').strip()
-            elif line.startswith('**Date:**'):
-                article_data['date'] = line.replace('**Date:**', '').strip()
-            elif line.startswith('**Location:**'):
-                article_data['location'] = line.replace('**Location:**', '').strip()
-
-        # Extract body text (all paragraphs after the title)
+        # Extract metadata and the body text (all paragraphs after the
+        # title) in one pass over the lines
         body_lines = []
         found_title = False
-        for line in lines:
+        for line in article_content.split('\n'):
             if line.startswith('### '):
+                article_data['title'] = line.replace('### ', '').strip()
                 found_title = True
                 continue
-            if found_title:
-                # Skip metadata lines and separator lines
-                if (line.strip() and
-                    not line.startswith('**') and
-                    not line.startswith('---') and
-                    not line.startswith('##')):
-                    body_lines.append(line.strip())
+            if line.startswith('**'):
+                for prefix, field in _META_PREFIXES:
+                    if line.startswith(prefix):
+                        article_data[field] = line.replace(prefix, '').strip()
+                        break
+                continue
+            # Skip empty and separator lines
+            if (found_title and line.strip() and
+                not line.startswith('---') and
+                not line.startswith('##')):
+                body_lines.append(line.strip())
 
         article_data['body'] = ' '.join(body_lines)
 
@@ -75,8 +151,21 @@ def parse_articles(file_path):
     return articles
 
 
-def process_articles_to_csv(articles_file, output_file):
-    """Process articles and save events to CSV."""
+def process_articles_to_csv(articles_file, output_file, workers=1, cache_dir=None,
+                            output_format='csv'):
+    """
+    Process articles and save events to CSV.
+
+    With workers > 1 the articles are annotated by that many processes,
+    each with its own pipeline talking to the shared CoreNLP server.
+    Events are still written in article order.
+
+    With cache_dir set, NLP annotations are pickled there keyed by a hash
+    of the article body, so re-runs skip CoreNLP for unchanged articles.
+
+    With output_format='jsonl' each event is written as one JSON object
+    per line (same fields) to output_file with a .jsonl suffix.
+    """
 
     print("=" * 80)
     print("PROCESSING ARTICLES TO CSV")
@@ -92,126 +181,161 @@ def process_articles_to_csv(articles_file, output_file):
     config = {
         'stanford_corenlp': {
             'path': './stanford-corenlp-4.5.5',
-            'memory': '4g'
+            'memory': '4g',
+            'use_coref': True  # Event extraction resolves actors via coreference
         }
     }
 
-    pipeline = ViolentEventNLPPipeline(config)
-    violence_lexicon = ViolenceLexicon()
-    african_ner = AfricanNER()
-    extractor = EventExtractor(violence_lexicon, african_ner)
-    print("Pipeline initialized successfully\n")
-
-    # Process each article and collect events
-    all_events = []
-
-    for i, article in enumerate(articles, 1):
-        article_id = f"article_{i}"
-        title = article.get('title', 'Unknown')
-
-        print(f"Processing Article {i}/{len(articles)}: {title[:60]}...")
-
-        # Process through NLP pipeline
-        article_annotation = pipeline.process_article(article['body'], article_id)
-
-        # Extract events (pass article date for date normalization)
-        article_date = article.get('date', '')
-        events = extractor.extract_events(article_annotation, article_date)
-
-        print(f"  ✓ Extracted {len(events)} event(s)")
-
-        # Convert events to CSV rows
-        for event_num, event in enumerate(events, 1):
-            row = {
-                'article_id': article_id,
-                'event_id': f"{article_id}_event_{event_num}",
-                'article_title': title,
-                'article_source': article.get('source', ''),
-                'article_date': article.get('date', ''),
-                'article_location': article.get('location', ''),
-                'article_type': article.get('type', ''),
-
-                # Event details
-                'trigger_word': event.get('trigger', {}).get('word', ''),
-                'trigger_lemma': event.get('trigger', {}).get('lemma', ''),
-                'sentence_index': event.get('trigger', {}).get('sentence_index', ''),
-
-                # 5W1H
-                'who_actor': event.get('who', {}).get('text', '') if event.get('who') else '',
-                'who_type': event.get('who', {}).get('type', '') if event.get('who') else '',
-
-                'what_event_type': event.get('what', {}).get('preliminary_type', '') if event.get('what') else '',
-
-                'whom_victim': event.get('whom', {}).get('text', '') if event.get('whom') else '',
-                'whom_type': event.get('whom', {}).get('type', '') if event.get('whom') else '',
-                'deaths': event.get('whom', {}).get('deaths', '') if event.get('whom') else '',
-                'injuries': event.get('whom', {}).get('injuries', '') if event.get('whom') else '',
-
-                'where_location': event.get('where', {}).get('text', '') if event.get('where') else '',
-                'where_type': event.get('where', {}).get('type', '') if event.get('where') else '',
-
-                'when_time': event.get('when', {}).get('text', '') if event.get('when') else '',
-                'when_type': event.get('when', {}).get('type', '') if event.get('when') else '',
-                'when_normalized': event.get('when', {}).get('normalized', '') if event.get('when') else '',
-
-                'how_weapons': ', '.join(event.get('how', {}).get('weapons', [])) if event.get('how') else '',
-                'how_tactics': ', '.join(event.get('how', {}).get('tactics', [])) if event.get('how') else '',
-
-                # Taxonomy
-                'taxonomy_l1': event.get('taxonomy_l1', ''),
-                'taxonomy_l2': event.get('taxonomy_l2', ''),
-                'taxonomy_l3': event.get('taxonomy_l3', ''),
-
-                # Quality metrics
-                'confidence': f"{event.get('confidence', 0):.2f}",
-                'completeness': f"{event.get('completeness', 0):.2f}",
-            }
-
-            all_events.append(row)
-
-    # Write to CSV
-    print(f"\nWriting {len(all_events)} events to CSV: {output_file}")
-
-    # Ensure the destination directory exists before attempting to write.
-    output_path = Path(output_file)
-    if output_path.parent and not output_path.parent.exists():
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    fieldnames = [
-        'article_id', 'event_id', 'article_title', 'article_source', 'article_date',
-        'article_location', 'article_type',
-        'trigger_word', 'trigger_lemma', 'sentence_index',
-        'who_actor', 'who_type',
-        'what_event_type',
-        'whom_victim', 'whom_type', 'deaths', 'injuries',
-        'where_location', 'where_type',
-        'when_time', 'when_type', 'when_normalized',
-        'how_weapons', 'how_tactics',
-        'taxonomy_l1', 'taxonomy_l2', 'taxonomy_l3',
-        'confidence', 'completeness'
-    ]
-
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_events)
-
-    print(f"✓ CSV file created successfully!")
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        print(f"Caching NLP annotations in: {cache_dir}")
+
+    items = [(f"article_{i}", article) for i, article in enumerate(articles, 1)]
+    executor = None
+    if workers > 1:
+        # CoreNLP requests are I/O bound, so several clients keep the
+        # server busy while each process runs its own event extraction
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_init_worker,
+                                       initargs=(config, cache_dir))
+        results = executor.map(_extract_article_events, items)
+        print(f"Processing with {workers} worker processes\n")
+    else:
+        _init_worker(config, cache_dir)
+        results = map(_extract_article_events, items)
+        print("Pipeline initialized successfully\n")
+
+    try:
+        # Ensure the destination directory exists before attempting to write.
+        output_path = Path(output_file)
+        if output_path.parent and not output_path.parent.exists():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fieldnames = [
+            'article_id', 'event_id', 'article_title', 'article_source', 'article_date',
+            'article_location', 'article_type',
+            'trigger_word', 'trigger_lemma', 'sentence_index',
+            'who_actor', 'who_type',
+            'what_event_type',
+            'whom_victim', 'whom_type', 'deaths', 'injuries',
+            'where_location', 'where_type',
+            'when_time', 'when_type', 'when_normalized',
+            'how_weapons', 'how_tactics',
+            'taxonomy_l1', 'taxonomy_l2', 'taxonomy_l3',
+            'confidence', 'completeness'
+        ]
+
+        if output_format == 'jsonl':
+            output_path = output_path.with_suffix('.jsonl')
+            outfile = open(output_path, 'wb', buffering=1 << 20)
+
+            def write_row(row):
+                outfile.write(_json_dumps(dict(zip(fieldnames, row))) + b'\n')
+        else:
+            outfile = open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            writer = csv.writer(outfile)
+            writer.writerow(fieldnames)
+            write_row = writer.writerow
+
+        # Process each article and stream its events to the file as it completes
+        print(f"Writing events to {output_format.upper()}: {output_path}\n")
+        num_events = 0
+
+        with outfile:
+            for i, ((article_id, article), events) in enumerate(zip(items, results), 1):
+                title = article.get('title', 'Unknown')
+
+                print(f"Processing Article {i}/{len(articles)}: {title[:60]}...")
+                print(f"  ✓ Extracted {len(events)} event(s)")
+
+                # Convert events to CSV rows (values in fieldnames order)
+                for event_num, event in enumerate(events, 1):
+                    # Missing or empty components become empty dicts (blank cells)
+                    trigger = event.get('trigger') or {}
+                    who = event.get('who') or {}
+                    what = event.get('what') or {}
+                    whom = event.get('whom') or {}
+                    where = event.get('where') or {}
+                    when = event.get('when') or {}
+                    how = event.get('how') or {}
+
+                    write_row((
+                        article_id,
+                        f"{article_id}_event_{event_num}",
+                        title,
+                        article.get('source', ''),
+                        article.get('date', ''),
+                        article.get('location', ''),
+                        article.get('type', ''),
+
+                        # Event details
+                        trigger.get('word', ''),
+                        trigger.get('lemma', ''),
+                        trigger.get('sentence_index', ''),
+
+                        # 5W1H
+                        who.get('text', ''),
+                        who.get('type', ''),
+
+                        what.get('preliminary_type', ''),
+
+                        whom.get('text', ''),
+                        whom.get('type', ''),
+                        whom.get('deaths', ''),
+                        whom.get('injuries', ''),
+
+                        where.get('text', ''),
+                        where.get('type', ''),
+
+                        when.get('text', ''),
+                        when.get('type', ''),
+                        when.get('normalized', ''),
+
+                        ', '.join(how.get('weapons', [])),
+                        ', '.join(how.get('tactics', [])),
+
+                        # Taxonomy
+                        event.get('taxonomy_l1', ''),
+                        event.get('taxonomy_l2', ''),
+                        event.get('taxonomy_l3', ''),
+
+                        # Quality metrics
+                        f"{event.get('confidence', 0):.2f}",
+                        f"{event.get('completeness', 0):.2f}",
+                    ))
+                    num_events += 1
+    finally:
+        # Also on failure, so worker processes never outlive the run
+        if executor is not None:
+            executor.shutdown()
+
+    print(f"✓ {output_format.upper()} file created successfully!")
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print(f"Total articles processed: {len(articles)}")
-    print(f"Total events extracted: {len(all_events)}")
-    print(f"Average events per article: {len(all_events) / len(articles):.1f}")
-    print(f"Output file: {output_file}")
+    print(f"Total events extracted: {num_events}")
+    print(f"Average events per article: {num_events / len(articles):.1f}")
+    print(f"Output file: {output_path}")
     print("=" * 80)
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Process articles.md into an events CSV')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of worker processes (default: 1)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Cache NLP annotations in .cache/annotations and reuse them on re-runs')
+    parser.add_argument('--format', default='csv', choices=['csv', 'jsonl'],
+                        help='Output format (default: csv)')
+    args = parser.parse_args()
+
     # Set paths
     base_dir = Path(__file__).parent
     articles_file = base_dir / 'articles.md'
     output_file = base_dir / 'output' / 'extracted_events.csv'
+    cache_dir = base_dir / '.cache' / 'annotations' if args.cache else None
 
     # Process
-    process_articles_to_csv(articles_file, output_file)
+    process_articles_to_csv(articles_file, output_file, workers=args.workers,
+                            cache_dir=cache_dir, output_format=args.format)
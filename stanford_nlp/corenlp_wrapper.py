@@ -1,32 +1,165 @@
-import json
+import os
+import re
+import functools
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
 import logging
 
+# orjson decodes large CoreNLP responses several times faster than the
+# standard library; fall back to json when it is not installed
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
+
+# Annotators used by the pipeline. Coreference is by far the most expensive
+# annotator and is only added when a caller opts in.
+DEFAULT_ANNOTATORS = 'tokenize,ssplit,pos,lemma,ner,depparse'
+
+# Text without a single word character (stray punctuation, separators)
+# yields no usable sentences, so it is not sent to the server
+_HAS_WORD = re.compile(r'\w')
+
+# Upper bound on pooled keep-alive connections, and therefore on useful
+# concurrent requests from one wrapper
+_POOL_MAXSIZE = 16
+
+
+@functools.lru_cache(maxsize=32)
+def _server_properties(annotators: str):
+    """Serialized CoreNLP request properties, encoded once per annotator set."""
+    properties = {
+        'annotators': annotators,
+        'outputFormat': 'json'
+    }
+    if 'coref' in annotators:
+        properties['coref.algorithm'] = 'statistical'
+    return _json_dumps(properties)
+
+
+# Shared instances of POS, NER and dependency labels. These come from a
+# small closed set but the JSON decoder creates a new string for every
+# token, so large annotations would otherwise hold thousands of copies.
+_TAG_POOL: Dict[str, str] = {}
+
+
+# Sentinel sentence placed between documents in a batched CoreNLP request.
+# A single alphanumeric token keeps CoreNLP from splitting it apart.
+_DOCUMENT_BREAK = 'ZZDOCUMENTBREAKZZ'
+DOCUMENT_SEPARATOR = f"\n\n{_DOCUMENT_BREAK}.\n\n"
+
+
+def _split_batch_annotation(annotation: Dict, num_documents: int) -> List[Dict]:
+    """
+    Partition a batched CoreNLP annotation back into per-document annotations.
+
+    Sentences are re-indexed from zero within each document and coreference
+    mentions are renumbered accordingly; chains are split per document.
+
+    Args:
+        annotation: Annotation of the sentinel-joined documents
+        num_documents: Number of documents in the batch
+
+    Returns:
+        One annotation dict per document
+
+    Raises:
+        ValueError: If the sentinels cannot be located unambiguously
+    """
+    documents = [{'sentences': [], 'coref_chains': []} for _ in range(num_documents)]
+    # Global 1-based sentence number -> (document, local 1-based number)
+    sentence_map = {}
+    current = 0
+
+    for global_idx, sent in enumerate(annotation.get('sentences', [])):
+        words = [t['word'] for t in sent.get('tokens', [])]
+        if _DOCUMENT_BREAK in words:
+            if words not in ([_DOCUMENT_BREAK], [_DOCUMENT_BREAK, '.']):
+                raise ValueError("Document sentinel merged into a sentence")
+            current += 1
+            if current >= num_documents:
+                raise ValueError("Unexpected document sentinel")
+            continue
+
+        sentences = documents[current]['sentences']
+        sent['index'] = len(sentences)
+        sentences.append(sent)
+        sentence_map[global_idx + 1] = (current, len(sentences))
+
+    if current != num_documents - 1:
+        raise ValueError(f"Found {current} document sentinels, expected {num_documents - 1}")
+
+    for chain in annotation.get('coref_chains', []):
+        per_document = {}
+        for mention in chain['mentions']:
+            location = sentence_map.get(mention.get('sentNum'))
+            if location is None:
+                continue
+            doc_idx, local_num = location
+            per_document.setdefault(doc_idx, []).append(dict(mention, sentNum=local_num))
+        for doc_idx, mentions in per_document.items():
+            documents[doc_idx]['coref_chains'].append({'id': chain['id'], 'mentions': mentions})
+
+    return documents
+
 
 class CoreNLPWrapper:
     """Stanford CoreNLP server wrapper with full NLP capabilities."""
 
-    def __init__(self, corenlp_path: str, memory: str = '4g'):
+    def __init__(self, corenlp_path: str, memory: str = '4g',
+                 annotators: str = DEFAULT_ANNOTATORS, server_url: str = None,
+                 cache_size: int = 0):
         """
         Initialize Stanford CoreNLP wrapper.
 
         Args:
             corenlp_path: Path to Stanford CoreNLP directory
             memory: Memory allocation for server (e.g., '4g', '6g')
+            annotators: Comma-separated annotators requested by default
+            server_url: URL of an already running (possibly shared) CoreNLP
+                server. When given, the local CoreNLP directory is not required.
+            cache_size: Number of annotate() results to keep in an in-memory
+                LRU cache keyed by text and annotators (0 disables caching)
 
         Raises:
-            FileNotFoundError: If CoreNLP directory not found
+            FileNotFoundError: If CoreNLP directory not found and no server_url
             ConnectionError: If cannot connect to CoreNLP server
         """
         self.corenlp_path = Path(corenlp_path).expanduser()
         self.memory = memory
+        self.annotators = annotators
         self.logger = logging.getLogger(__name__)
-        self.server_url = "http://localhost:9000"
+        self.server_url = server_url or "http://localhost:9000"
+        # Annotation is deterministic for a given text and annotator set.
+        # Results are stored serialized so every hit returns fresh objects
+        # that callers may modify.
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # One keep-alive session per wrapper so repeated annotate() calls
+        # reuse the same TCP connection instead of reconnecting each time
+        self.session = requests.Session()
+        # A busy CoreNLP server answers 503; retry those (and gateway
+        # errors) with a short backoff. Connection and read failures are
+        # not retried, so a missing server still fails fast.
+        retry = Retry(total=3, connect=0, read=0, backoff_factor=0.2,
+                      status_forcelist=(502, 503, 504),
+                      allowed_methods=frozenset({'GET', 'POST'}),
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
-        # Check if CoreNLP directory exists
-        if not self.corenlp_path.exists():
+        # Check if CoreNLP directory exists (only needed for a local server)
+        if server_url is None and not self.corenlp_path.exists():
             raise FileNotFoundError(
                 f"Stanford CoreNLP not found at: {self.corenlp_path}\n"
                 f"Please ensure Stanford CoreNLP is downloaded and extracted."
@@ -34,7 +167,7 @@ class CoreNLPWrapper:
 
         # Try to connect to Stanford CoreNLP server
         try:
-            response = requests.get(self.server_url, timeout=2)
+            response = self.session.get(self.server_url, timeout=2)
             self.logger.info("✓ Connected to Stanford CoreNLP server")
         except (requests.ConnectionError, requests.Timeout) as e:
             raise ConnectionError(
@@ -42,35 +175,41 @@ class CoreNLPWrapper:
                 f"Please start the server using: ./start_corenlp_server.sh"
             ) from e
 
-    def annotate(self, text: str) -> Dict:
+    def annotate(self, text: str, annotators: str = None) -> Dict:
         """
         Annotate text using Stanford CoreNLP server.
 
-        Uses full annotator pipeline: tokenize, ssplit, pos, lemma, ner, depparse, coref
-
         Args:
             text: Text to annotate
+            annotators: Comma-separated annotators for this call
+                (defaults to the wrapper's annotators)
 
         Returns:
             Dict containing:
                 - sentences: List of annotated sentences with tokens, NER, dependencies
-                - coref_chains: Coreference resolution chains
+                - coref_chains: Coreference resolution chains (empty unless
+                  the coref annotator was requested)
 
         Raises:
             Exception: If server returns error status
         """
-        if not text or not text.strip():
+        if not text or not _HAS_WORD.search(text):
             return {'sentences': [], 'coref_chains': []}
 
-        properties = {
-            'annotators': 'tokenize,ssplit,pos,lemma,ner,depparse,coref',
-            'outputFormat': 'json',
-            'coref.algorithm': 'statistical'
-        }
+        annotators = annotators or self.annotators
+        cache_key = None
+        if self.cache_size > 0:
+            cache_key = hashlib.sha1(f"{annotators}\0{text}".encode('utf-8')).digest()
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                return _json_loads(cached)
 
-        response = requests.post(
+        response = self.session.post(
             self.server_url,
-            params={'properties': json.dumps(properties)},
+            params={'properties': _server_properties(annotators)},
             data=text.encode('utf-8'),
             headers={'Content-Type': 'text/plain; charset=utf-8'},
             timeout=30
@@ -79,27 +218,36 @@ class CoreNLPWrapper:
         if response.status_code != 200:
             raise Exception(f"Server returned status {response.status_code}")
 
-        result = response.json()
+        result = _json_loads(response.content)
+        # Release the raw payload, and each raw sentence once it has been
+        # reshaped, so a large annotation is never held twice in memory
+        del response
+        raw_sentences = result.pop('sentences', [])
 
         # Process sentences to match our expected format
         processed_sentences = []
-        for sent in result.get('sentences', []):
+        tag = _TAG_POOL.setdefault
+        for sent_idx, sent in enumerate(raw_sentences):
+            raw_sentences[sent_idx] = None
             tokens = []
             for token in sent.get('tokens', []):
+                pos = token.get('pos')
+                ner = token.get('ner', 'O')
                 tokens.append({
                     'index': token.get('index'),
-                    'word': token.get('word'),
+                    'word': token.get('word', ''),
                     'originalText': token.get('originalText'),
                     'lemma': token.get('lemma'),
-                    'pos': token.get('pos'),
-                    'ner': token.get('ner', 'O')
+                    'pos': tag(pos, pos),
+                    'ner': tag(ner, ner)
                 })
 
             # Extract dependencies
             dependencies = []
             for dep in sent.get('basicDependencies', []):
+                relation = dep.get('dep')
                 dependencies.append({
-                    'dep': dep.get('dep'),
+                    'dep': tag(relation, relation),
                     'governor': dep.get('governorGloss'),
                     'dependent': dep.get('dependentGloss'),
                     'governor_idx': dep.get('governor'),
@@ -131,11 +279,85 @@ class CoreNLPWrapper:
                     })
                 coref_chains.append(chain)
 
-        return {
+        annotation = {
             'sentences': processed_sentences,
             'coref_chains': coref_chains
         }
 
+        if cache_key is not None:
+            serialized = _json_dumps(annotation)
+            with self._cache_lock:
+                self._cache[cache_key] = serialized
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return annotation
+
+    def annotate_batch(self, texts: List[str], annotators: str = None) -> List[Dict]:
+        """
+        Annotate several documents with a single request to the server.
+
+        The documents are joined with sentinel sentences and the server's
+        sentences are partitioned back at the sentinels, so the HTTP round
+        trip and CoreNLP's per-request overhead are paid once per batch.
+        Keep the combined text below the server's request size limit
+        (1M characters by default). Coreference is resolved over the whole
+        request, so chains could link mentions across documents; batches
+        with the coref annotator are rejected, use annotate_many() instead.
+
+        Args:
+            texts: Documents to annotate
+            annotators: Comma-separated annotators for this call
+                (defaults to the wrapper's annotators)
+
+        Returns:
+            One annotation per document, in the same format as annotate()
+
+        Raises:
+            ValueError: If the batched annotation cannot be split back into
+                documents (e.g. a document ends mid-sentence), or if coref
+                is requested for more than one document
+            Exception: If server returns error status
+        """
+        if len(texts) <= 1:
+            return [self.annotate(text, annotators) for text in texts]
+        if 'coref' in (annotators or self.annotators):
+            raise ValueError("Coreference cannot be batched across documents")
+
+        annotation = self.annotate(DOCUMENT_SEPARATOR.join(texts), annotators)
+        return _split_batch_annotation(annotation, len(texts))
+
+    def annotate_many(self, texts: Iterable[str], annotators: str = None,
+                      max_workers: int = None) -> List[Dict]:
+        """
+        Annotate documents concurrently, one request per document.
+
+        annotate() spends its time waiting on the server, so threads
+        overlap the requests and the CoreNLP server (multi-threaded by
+        default) works on several documents at once.
+
+        Args:
+            texts: Documents to annotate
+            annotators: Comma-separated annotators for this call
+                (defaults to the wrapper's annotators)
+            max_workers: Number of concurrent requests (defaults to the
+                CPU count, capped at the connection pool size)
+
+        Returns:
+            One annotation per document, in input order
+
+        Raises:
+            Exception: If server returns error status for any document
+        """
+        texts = list(texts)
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, _POOL_MAXSIZE)
+        if max_workers <= 1 or len(texts) <= 1:
+            return [self.annotate(text, annotators) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(lambda text: self.annotate(text, annotators), texts))
+
     def get_tokens(self, sentence: Dict) -> List[Dict]:
         """Extract tokens from sentence annotation."""
         return sentence.get('tokens', [])
@@ -172,17 +394,22 @@ class CoreNLPWrapper:
 
     def get_dependencies(self, sentence: Dict) -> List[Dict]:
         """Extract dependency relations from sentence annotation."""
-        deps = sentence.get('basicDependencies', [])
         result = []
-        for dep in deps:
+        for dep in sentence.get('basicDependencies', []):
+            relation = dep.get('dep', '')
             result.append({
-                'relation': dep.get('dep', ''),
+                'relation': relation,
                 'governor': dep.get('governorGloss', ''),
                 'dependent': dep.get('dependentGloss', ''),
-                'dep': dep.get('dep', ''),  # Keep for compatibility
+                'dep': relation,  # Keep for compatibility
             })
         return result
 
+    def clear_cache(self):
+        """Drop all cached annotations."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def close(self):
-        """Close resources (no-op for HTTP client)."""
-        pass
+        """Close the HTTP session and release pooled connections."""
+        self.session.close()
@@ -96,7 +96,8 @@ def stage2_nlp_pipeline(args, articles=None):
     config = {
         'stanford_corenlp': {
             'path': './stanford-corenlp-4.5.5',
-            'memory': '4g'
+            'memory': '4g',
+            'use_coref': True  # Event extraction resolves actors via coreference
         }
     }
     print("Initializing NLP pipeline...")
@@ -167,7 +168,7 @@ def stage3_event_extraction(args, nlp_results=None):
         if args.article and len(articles) > 1:
             articles = [articles[args.article - 1]]
 
-        config = {'stanford_corenlp': {'path': './stanford-corenlp-4.5.5', 'memory': '4g'}}
+        config = {'stanford_corenlp': {'path': './stanford-corenlp-4.5.5', 'memory': '4g', 'use_coref': True}}
         pipeline = ViolentEventNLPPipeline(config)
 
         nlp_results = []
@@ -8,6 +8,7 @@ from domain.african_ner import AfricanNER
 from domain.violence_lexicon import ViolenceLexicon
 from event_extraction import EventExtractor
 from pipeline import ViolentEventNLPPipeline
+import process_articles_to_csv
 
 
 def test_batch_processor_handles_invalid_articles(tmp_path):
@@ -31,3 +32,22 @@ def test_batch_processor_handles_invalid_articles(tmp_path):
     summary_files = list(Path(tmp_path).glob('*_summary.json'))
     assert summary_files, 'Expected a summary JSON file to be written.'
     assert summary_files[0].exists()
+
+
+def test_annotate_article_does_not_cache_failed_annotations(tmp_path, monkeypatch):
+    class FailingPipeline:
+        calls = 0
+
+        def process_article(self, article_text, article_id):
+            FailingPipeline.calls += 1
+            return {'article_id': article_id, 'sentences': [], 'error': 'Server returned status 503'}
+
+    monkeypatch.setattr(process_articles_to_csv, '_worker_pipeline', FailingPipeline())
+    monkeypatch.setattr(process_articles_to_csv, '_worker_cache_dir', tmp_path)
+
+    for _ in range(2):
+        result = process_articles_to_csv._annotate_article('article_1', 'Gunmen attacked Gao.')
+        assert result['error']
+
+    assert FailingPipeline.calls == 2
+    assert not list(tmp_path.iterdir())
@@ -1,4 +1,4 @@
-from stanford_nlp.corenlp_wrapper import CoreNLPWrapper
+from stanford_nlp.corenlp_wrapper import CoreNLPWrapper, _DOCUMENT_BREAK, _split_batch_annotation
 
 
 def test_lightweight_annotation_provides_tokens_and_entities():
@@ -19,3 +19,24 @@ def test_lightweight_annotation_provides_tokens_and_entities():
     second_sentence = annotation['sentences'][1]
     dependencies = wrapper.get_dependencies(second_sentence)
     assert dependencies[0]['relation'] == 'root'
+
+
+def test_split_batch_annotation_partitions_sentences_and_corefs():
+    def sentence(*words):
+        return {'tokens': [{'word': w} for w in words]}
+
+    annotation = {
+        'sentences': [sentence('Gunmen', 'attacked', '.'),
+                      sentence(_DOCUMENT_BREAK, '.'),
+                      sentence('Troops', 'arrived', '.'),
+                      sentence('They', 'left', '.')],
+        'coref_chains': [{'id': '1', 'mentions': [{'sentNum': 3, 'text': 'Troops'},
+                                                  {'sentNum': 4, 'text': 'They'}]}],
+    }
+
+    first, second = _split_batch_annotation(annotation, 2)
+
+    assert [s['index'] for s in first['sentences']] == [0]
+    assert [s['index'] for s in second['sentences']] == [0, 1]
+    assert first['coref_chains'] == []
+    assert [m['sentNum'] for m in second['coref_chains'][0]['mentions']] == [1, 2]
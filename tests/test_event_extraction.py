@@ -20,3 +20,13 @@ def test_event_extractor_detects_trigger_and_entities():
     assert event['trigger']['lemma'].startswith('kill')
     assert event['where']['text'] == 'Maiduguri'
     assert event['when']['text']
+
+
+def test_african_ner_matches_gazetteer_names_in_order():
+    ner = AfricanNER()
+
+    locations = ner.recognize_location("Clashes in SOUTH SUDAN spread towards Mogadishu.")
+    assert [name for name, _ in locations] == ['Sudan', 'South Sudan', 'Mogadishu']
+
+    actors = ner.recognize_actor("The Allied Democratic Forces (ADF) attacked Beni.")
+    assert [name for name, _ in actors] == ['ADF', 'ADF']
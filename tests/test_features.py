@@ -36,3 +36,19 @@ def test_syntactic_feature_extractor_counts_dependency_signals():
     assert features['num_nouns'] == 2
     assert features['has_violence_verb'] is True
     assert features['has_agent_patient'] is True
+
+
+def test_lexical_feature_extractor_shares_frozen_lexicon():
+    terms = frozenset(ViolenceLexicon().all_terms)
+    extractor = LexicalFeatureExtractor(terms)
+
+    assert extractor.violence_lexicon is terms
+    assert extractor.extract_features(['Gunmen', 'attacked'])['violence_term_count'] == 2
+
+
+def test_violence_lexicon_term_category_prefers_verbs():
+    lexicon = ViolenceLexicon()
+
+    assert lexicon.get_term_category('Attack') == 'violence_verb'
+    assert lexicon.get_term_category('explosives') == 'violence_noun'
+    assert lexicon.get_term_category('market') == 'other'
@@ -17,6 +17,14 @@ def test_text_cleaner_strips_html_and_extracts_metadata():
     assert metadata['has_violence_content'] is True
 
 
+def test_text_cleaner_fixes_smart_quotes_and_mojibake():
+    cleaner = TextCleaner()
+    raw = "\u201cWe fled,\u201d a resident said \u2014 it\u2019s the third attack this month. The army\u00e2\u20ac\u2122s base was hit."
+
+    cleaned = cleaner.clean(raw)
+    assert cleaned == "\"We fled,\" a resident said - it's the third attack this month. The army's base was hit."
+
+
 def test_sentence_splitter_preserves_african_context():
     splitter = SentenceSplitter()
     text = "Dr. Smith visited the U.N. headquarters. Boko Haram was mentioned in the briefing."
@@ -24,3 +32,28 @@ def test_sentence_splitter_preserves_african_context():
     sentences = splitter.split(text)
     assert len(sentences) == 2
     assert any('Boko Haram' in sentence for sentence in sentences)
+
+
+def test_sentence_splitter_restores_abbreviations_inside_quotes():
+    splitter = SentenceSplitter()
+    text = 'Officials said "The UN convoy was attacked near the border." Three people were hurt.'
+
+    sentences = splitter.split(text)
+    assert all('<ABBR_' not in sentence for sentence in sentences)
+    assert any('The UN convoy' in sentence for sentence in sentences)
+
+
+def test_sentence_splitter_split_batch_matches_split():
+    splitter = SentenceSplitter()
+    splitter.add_abbreviation('Op. Hadin Kai')
+    texts = [
+        "Gunmen attacked the village at dawn. Residents fled into the bush.",
+        "",
+        "Troops of Op. Hadin Kai repelled the attack. Two soldiers were hurt.",
+    ]
+    expected = [splitter.split(text) for text in texts]
+
+    assert splitter.split_batch(texts) == expected
+    # Worker processes must split with the customised copy of the splitter
+    assert splitter.split_batch(texts, n_workers=2, chunksize=1) == expected
+    assert expected[2][0] == "Troops of Op. Hadin Kai repelled the attack."